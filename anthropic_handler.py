@@ -14,7 +14,37 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import anthropic
-from api_handler import APIHandler
+import httpx
+from api_handler import APIHandler, cached_response, cached_stream
+
+# Pooled HTTP clients shared by every handler instance, so sockets
+# survive across calls and across handler rebuilds
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+_http_client = None
+_async_http_client = None
+
+def _get_http_client():
+    """Get the shared sync httpx client, creating it on first use.
+
+    Returns:
+        The shared httpx.Client
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    return _http_client
+
+def _get_async_http_client():
+    """Get the shared async httpx client, creating it on first use.
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _async_http_client
+    if _async_http_client is None:
+        _async_http_client = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    return _async_http_client
 
 class AnthropicHandler(APIHandler):
     """Handler for Anthropic API interactions."""
@@ -29,18 +59,24 @@ class AnthropicHandler(APIHandler):
         super().__init__(logger)
         self.api_key = api_key
         self.client = None
+        self.async_client = None
         if api_key:
             self.set_api_key(api_key)
-    
+
     def set_api_key(self, api_key):
         """Set the Anthropic API key.
-        
+
         Args:
             api_key: The Anthropic API key
         """
         self.api_key = api_key
         try:
-            self.client = anthropic.Anthropic(api_key=api_key)
+            self.client = anthropic.Anthropic(
+                api_key=api_key, http_client=_get_http_client()
+            )
+            self.async_client = anthropic.AsyncAnthropic(
+                api_key=api_key, http_client=_get_async_http_client()
+            )
             if self.logger:
                 self.logger.log("Anthropic API key set", "Anthropic")
         except Exception as e:
@@ -62,61 +98,180 @@ class AnthropicHandler(APIHandler):
             self.logger.log(f"Loaded {len(models)} Anthropic models", "Anthropic")
         return models
     
-    def get_response(self, prompt):
-        """Get a response from Anthropic for the given prompt.
-        
-        Args:
-            prompt: The user's message to send to Anthropic
-            
+    def _check_ready(self):
+        """Check that the handler can issue a request.
+
         Returns:
-            The AI's response text
+            An error message string, or None if ready
         """
         if not self.api_key or not self.client:
             if self.logger:
                 self.logger.log("API key not set", "Error")
             return "Error: Anthropic API key not set"
-            
+
         if not self.selected_model:
             if self.logger:
                 self.logger.log("No model selected", "Error")
             return "Error: No model selected"
-        
-        # Convert conversation history to Anthropic format
+        return None
+
+    def _build_messages(self, prompt):
+        """Build the messages list for a request.
+
+        The conversation history already stores messages in Anthropic
+        format, so in the common case the history dicts are passed
+        through unchanged. The Anthropic API accepts only alternating
+        user/assistant roles inside messages, so the windowing
+        summary (a system message) is re-rolled as a user message and
+        consecutive same-role messages — possible across the window's
+        kept-head gap — are merged.
+
+        Args:
+            prompt: The user's message to send to Anthropic
+
+        Returns:
+            List of messages in Anthropic format
+        """
+        self.record_message("user", prompt)
         messages = []
-        
-        # Add system prompt if available
-        system_prompt = self.system_prompt if self.system_prompt else ""
-        
-        # Add conversation history
-        for msg in self.conversation_history:
-            role = msg["role"]
-            content = msg["content"]
-            if role == "user":
-                messages.append({"role": "user", "content": content})
-            elif role == "assistant":
-                messages.append({"role": "assistant", "content": content})
-        
-        # Add current prompt
-        self.conversation_history.append({"role": "user", "content": prompt})
-        messages.append({"role": "user", "content": prompt})
-        
+        for msg in self._windowed_history():
+            if msg["role"] == "system":
+                msg = {"role": "user", "content": msg["content"]}
+            if messages and messages[-1]["role"] == msg["role"]:
+                messages[-1] = {"role": msg["role"],
+                                "content": messages[-1]["content"]
+                                + "\n\n" + msg["content"]}
+            else:
+                messages.append(msg)
+        return messages
+
+    def _system_param(self):
+        """Build the system argument with server-side prompt caching.
+
+        Marking the system block with cache_control lets Anthropic reuse
+        the processed prefix across turns instead of re-processing it.
+
+        Returns:
+            Structured system blocks, or "" when no system prompt is set
+        """
+        if not self.system_prompt:
+            return ""
+        return [{
+            "type": "text",
+            "text": self.system_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }]
+
+    @cached_response
+    def get_response(self, prompt):
+        """Get a response from Anthropic for the given prompt.
+
+        Args:
+            prompt: The user's message to send to Anthropic
+
+        Returns:
+            The AI's response text
+        """
+        error = self._check_ready()
+        if error:
+            return error
+
+        messages = self._build_messages(prompt)
+
         try:
             if self.logger:
                 self.logger.log(f"Sending prompt to {self.selected_model}", "Anthropic")
-            
+
             response = self.client.messages.create(
                 model=self.selected_model,
                 messages=messages,
-                system=system_prompt,
+                system=self._system_param(),
                 max_tokens=1024
             )
-            
+
             assistant_response = response.content[0].text
-            self.conversation_history.append(
-                {"role": "assistant", "content": assistant_response}
-            )
+            self.record_message("assistant", assistant_response)
+            return assistant_response
+        except Exception as e:
+            self._pop_failed_turn()
+            if self.logger:
+                self.logger.log(f"Error generating response: {str(e)}", "Error")
+            self._show_error(f"Anthropic API error: {str(e)}")
+            return f"Error: Could not generate response - {str(e)}"
+
+    @cached_stream
+    def get_response_stream(self, prompt):
+        """Get a response from Anthropic as a stream of text chunks.
+
+        Args:
+            prompt: The user's message to send to Anthropic
+
+        Yields:
+            Chunks of the AI's response text
+        """
+        error = self._check_ready()
+        if error:
+            yield error
+            return
+
+        messages = self._build_messages(prompt)
+
+        try:
+            if self.logger:
+                self.logger.log(f"Streaming prompt to {self.selected_model}", "Anthropic")
+
+            parts = []
+            with self.client.messages.stream(
+                model=self.selected_model,
+                messages=messages,
+                system=self._system_param(),
+                max_tokens=1024
+            ) as stream:
+                for text in stream.text_stream:
+                    parts.append(text)
+                    yield text
+
+            self.record_message("assistant", "".join(parts))
+        except Exception as e:
+            self._pop_failed_turn()
+            if self.logger:
+                self.logger.log(f"Error generating response: {str(e)}", "Error")
+            self._show_error(f"Anthropic API error: {str(e)}")
+            yield f"Error: Could not generate response - {str(e)}"
+
+    @cached_response
+    async def aget_response(self, prompt):
+        """Get a response from Anthropic asynchronously.
+
+        Args:
+            prompt: The user's message to send to Anthropic
+
+        Returns:
+            The AI's response text
+        """
+        error = self._check_ready()
+        if error:
+            return error
+
+        messages = self._build_messages(prompt)
+
+        try:
+            if self.logger:
+                self.logger.log(f"Sending prompt to {self.selected_model}", "Anthropic")
+
+            async with self._request_semaphore:
+                response = await self.async_client.messages.create(
+                    model=self.selected_model,
+                    messages=messages,
+                    system=self._system_param(),
+                    max_tokens=1024
+                )
+
+            assistant_response = response.content[0].text
+            self.record_message("assistant", assistant_response)
             return assistant_response
         except Exception as e:
+            self._pop_failed_turn()
             if self.logger:
                 self.logger.log(f"Error generating response: {str(e)}", "Error")
             self._show_error(f"Anthropic API error: {str(e)}")
@@ -13,41 +13,103 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-from ollama_handler import OllamaHandler
-from openai_handler import OpenAIHandler
-from anthropic_handler import AnthropicHandler
-from grok_handler import GrokHandler
-from gemini_handler import GeminiHandler
+import asyncio
+import importlib
+
+from api_handler import run_coroutine
+
+# Dispatch table mapping api_type to (module, class name, constructor
+# arguments with defaults); modules are imported on first use so the
+# app only pays for the providers actually selected
+_HANDLERS = {
+    'ollama': ('ollama_handler', 'OllamaHandler',
+               (('address', 'http://localhost:11434'), ('session', None))),
+    'openai': ('openai_handler', 'OpenAIHandler', (('api_key', None),)),
+    'anthropic': ('anthropic_handler', 'AnthropicHandler', (('api_key', None),)),
+    'grok': ('grok_handler', 'GrokHandler',
+             (('api_key', None), ('session', None))),
+    'gemini': ('gemini_handler', 'GeminiHandler', (('api_key', None),)),
+}
 
 class APIFactory:
     """Factory class for creating API handlers."""
-    
+
     @staticmethod
     def create_handler(api_type, logger, **kwargs):
         """Create an API handler of the specified type.
-        
+
         Args:
             api_type: The type of API handler to create ('ollama', 'openai', 'anthropic', 'grok', 'gemini')
             logger: The logger instance
             **kwargs: Additional arguments to pass to the handler constructor
-            
+
         Returns:
             An instance of the specified API handler
         """
-        if api_type.lower() == 'ollama':
-            address = kwargs.get('address', 'http://localhost:11434')
-            return OllamaHandler(logger, address)
-        elif api_type.lower() == 'openai':
-            api_key = kwargs.get('api_key', None)
-            return OpenAIHandler(logger, api_key)
-        elif api_type.lower() == 'anthropic':
-            api_key = kwargs.get('api_key', None)
-            return AnthropicHandler(logger, api_key)
-        elif api_type.lower() == 'grok':
-            api_key = kwargs.get('api_key', None)
-            return GrokHandler(logger, api_key)
-        elif api_type.lower() == 'gemini':
-            api_key = kwargs.get('api_key', None)
-            return GeminiHandler(logger, api_key)
-        else:
-            raise ValueError(f"Unknown API type: {api_type}")
+        try:
+            module_name, class_name, arg_specs = _HANDLERS[api_type.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown API type: {api_type}") from None
+
+        handler_cls = getattr(importlib.import_module(module_name), class_name)
+        return handler_cls(logger, *(kwargs.get(name, default)
+                                     for name, default in arg_specs))
+
+    @staticmethod
+    def gather_responses(handlers, prompt):
+        """Get responses from several handlers concurrently.
+
+        Fans the prompt out to all handlers via their async API so the
+        round-trip costs the slowest provider instead of the sum of all
+        of them. Runs on the shared persistent loop, so the handlers'
+        pooled connections stay usable across repeated calls.
+
+        Args:
+            handlers: Iterable of APIHandler instances
+            prompt: The prompt to send to every handler
+
+        Returns:
+            List of response texts, in handler order
+        """
+        async def _gather():
+            return await asyncio.gather(
+                *(handler.aget_response(prompt) for handler in handlers)
+            )
+
+        return run_coroutine(_gather())
+
+    @staticmethod
+    def gather_models(handlers):
+        """Fetch several handlers' model lists concurrently.
+
+        Args:
+            handlers: Iterable of APIHandler instances
+
+        Returns:
+            List of model lists, in handler order
+        """
+        async def _gather():
+            return await asyncio.gather(
+                *(handler.aget_available_models() for handler in handlers)
+            )
+
+        return run_coroutine(_gather())
+
+    @staticmethod
+    def create_batch_runner(handler):
+        """Create a callable that dispatches a list of prompts.
+
+        Uses the handler's native batch support when available;
+        otherwise falls back to dispatching the prompts one by one.
+
+        Args:
+            handler: The APIHandler instance to dispatch through
+
+        Returns:
+            A callable taking a list of prompts and returning a list of
+            response texts
+        """
+        batch = getattr(handler, "get_responses_batch", None)
+        if batch is not None:
+            return batch
+        return lambda prompts: [handler.get_response(prompt) for prompt in prompts]
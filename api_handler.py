@@ -13,16 +13,186 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
+import functools
+import hashlib
+import itertools
+import json
+import threading
 from abc import ABC, abstractmethod
-from tkinter import messagebox
-import requests
+from collections import OrderedDict
+
+from response_cache import DiskResponseCache
+
+# Background loop shared by the synchronous fan-out entry points. One
+# persistent loop keeps the handlers' pooled async clients and their
+# loop-bound primitives valid across calls; asyncio.run would close its
+# loop each time and strand the keep-alive connections on it
+_worker_loop = None
+
+def run_coroutine(coro):
+    """Run a coroutine on the shared background loop and wait for it.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+        threading.Thread(target=_worker_loop.run_forever, daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _worker_loop).result()
+
+def cached_response(func):
+    """Decorate a get_response implementation with response caching.
+
+    The cache key covers the model, system prompt, conversation history
+    and prompt, so only an exact replay of a turn produces a hit. On a
+    hit the turn is recorded in the conversation history exactly as if
+    the API had been called.
+    """
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, prompt):
+            key = self._cache_key(prompt)
+            cached = self._cache_get(key, prompt)
+            if cached is not None:
+                return cached
+            response = await func(self, prompt)
+            self._cache_put(key, response, prompt)
+            return response
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, prompt):
+        key = self._cache_key(prompt)
+        cached = self._cache_get(key, prompt)
+        if cached is not None:
+            return cached
+        response = func(self, prompt)
+        self._cache_put(key, response, prompt)
+        return response
+    return wrapper
+
+def cached_stream(func):
+    """Decorate a get_response_stream implementation with response caching.
+
+    Shares the exact-match cache with cached_response: a hit yields the
+    stored response as one chunk and records the turn without touching
+    the API. On a miss the stream passes through and the joined text is
+    stored afterwards, but only when the handler committed the turn to
+    the history — a stream that errored part-way leaves the cache
+    untouched.
+    """
+    @functools.wraps(func)
+    def wrapper(self, prompt):
+        key = self._cache_key(prompt)
+        cached = self._cache_get(key, prompt)
+        if cached is not None:
+            yield cached
+            return
+        parts = []
+        for chunk in func(self, prompt):
+            parts.append(chunk)
+            yield chunk
+        response = ''.join(parts)
+        history = self.conversation_history
+        if history and history[-1] == {"role": "assistant", "content": response}:
+            self._cache_put(key, response, prompt)
+    return wrapper
+
+class SemanticResponseCache:
+    """Embedding-similarity response cache with vectorized lookup.
+
+    Embeddings are kept L2-normalized in one float32 matrix so a lookup
+    is a single matrix-vector product (one BLAS call) instead of a
+    Python loop over entries. The embedder is injected by the caller as
+    any callable mapping text to a 1-D vector, and numpy is imported on
+    first use, so both stay optional dependencies. Matching considers
+    the prompt only, so this suits stateless or replay-style use; it is
+    not attached to any handler by default.
+    """
+
+    def __init__(self, embedder, threshold=0.95):
+        """Initialize the semantic cache.
+
+        Args:
+            embedder: Callable mapping text to a 1-D embedding vector
+            threshold: Minimum cosine similarity for a hit
+        """
+        import numpy
+        self._np = numpy
+        self.embedder = embedder
+        self.threshold = threshold
+        self._matrix = None
+        self._responses = []
+
+    def _embed(self, text):
+        """Embed and L2-normalize a text.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            The normalized float32 embedding vector
+        """
+        np = self._np
+        vec = np.asarray(self.embedder(text), dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if norm > 0:
+            vec = vec / norm
+        return vec
+
+    def lookup(self, prompt):
+        """Look up the response cached for the most similar prompt.
+
+        Args:
+            prompt: The prompt to match
+
+        Returns:
+            The cached response text, or None if nothing is similar
+            enough
+        """
+        if self._matrix is None:
+            return None
+        sims = self._matrix @ self._embed(prompt)
+        best = int(sims.argmax())
+        if sims[best] >= self.threshold:
+            return self._responses[best]
+        return None
+
+    def store(self, prompt, response):
+        """Store a response under the prompt's embedding.
+
+        Args:
+            prompt: The prompt the response answers
+            response: The response text to store
+        """
+        np = self._np
+        vec = self._embed(prompt)[None, :]
+        if self._matrix is None:
+            self._matrix = vec
+        else:
+            self._matrix = np.vstack((self._matrix, vec))
+        self._responses.append(response)
 
 class APIHandler(ABC):
     """Abstract base class for API handlers."""
-    
+
+    # Maximum number of in-flight async requests per handler
+    MAX_CONCURRENT_REQUESTS = 4
+
+    # Maximum number of cached responses kept per handler
+    RESPONSE_CACHE_SIZE = 128
+
+    # Approximate characters per token, used for history budgeting
+    CHARS_PER_TOKEN = 4
+
     def __init__(self, logger):
         """Initialize the API handler.
-        
+
         Args:
             logger: The logger instance
         """
@@ -30,6 +200,23 @@ class APIHandler(ABC):
         self.conversation_history = []
         self.selected_model = None
         self.system_prompt = None
+        self._prefix = ()
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self.cache_enabled = True
+        self.cache_hits = 0
+        self._response_cache = OrderedDict()
+        self.disk_cache = DiskResponseCache.from_env()
+        self.semantic_cache = None
+        self.max_history_tokens = 8000
+        self.max_history_messages = 0
+        # Running token estimate for the whole history, maintained by
+        # record_message so windowing can skip its scan when everything
+        # already fits the budget
+        self._approx_tokens = 0
+        # Optional callable mapping a list of dropped middle messages
+        # to a short summary string; bridges the window gap when set
+        self.summarizer = None
+        self._middle_summary = None
     
     @abstractmethod
     def get_available_models(self):
@@ -56,10 +243,51 @@ class APIHandler(ABC):
         Args:
             system_prompt: The system prompt to use
         """
+        # Re-applying the same prompt must not perturb anything: the
+        # provider-side prompt cache keys on a byte-identical prefix,
+        # so an unchanged prompt is left untouched
+        if system_prompt == self.system_prompt:
+            return
         self.system_prompt = system_prompt
+        # Precompute the request prefix once per prompt change instead
+        # of branching on the system prompt every turn
+        self._prefix = (({"role": "system", "content": system_prompt},)
+                        if system_prompt else ())
         if self.logger:
             self.logger.log(f"Set system prompt for {self.selected_model}", self.__class__.__name__)
     
+    def record_message(self, role, content):
+        """Append one message to the conversation history.
+
+        All history growth goes through here so the running token
+        estimate stays in step with the list.
+
+        Args:
+            role: The message role ("user" or "assistant")
+            content: The message content
+        """
+        self.conversation_history.append({"role": role, "content": content})
+        self._approx_tokens += self._estimate_tokens(content)
+
+    def _build_messages(self, prompt):
+        """Build the messages list for a request.
+
+        Records the prompt in the conversation history, then prepends
+        the precomputed system prefix to the windowed history. The
+        history dicts are shared with the request list, not copied, so
+        each turn only allocates the new entry and the request prefix
+        (system prompt + committed turns) stays byte-identical across
+        turns, which provider-side prompt caches key on.
+
+        Args:
+            prompt: The user's message to send
+
+        Returns:
+            List of messages in chat format
+        """
+        self.record_message("user", prompt)
+        return [*self._prefix, *self._windowed_history()]
+
     @abstractmethod
     def get_response(self, prompt):
         """Get a response from the API for the given prompt.
@@ -71,25 +299,260 @@ class APIHandler(ABC):
             The AI's response text
         """
         pass
-    
+
+    async def aget_response(self, prompt):
+        """Get a response from the API asynchronously.
+
+        Subclasses with native async clients should override this; the
+        default runs the synchronous get_response in a worker thread so
+        multiple handlers can be awaited concurrently.
+
+        Args:
+            prompt: The user's message to send to the API
+
+        Returns:
+            The AI's response text
+        """
+        async with self._request_semaphore:
+            return await asyncio.to_thread(self.get_response, prompt)
+
+    async def aget_available_models(self):
+        """Get the list of available models asynchronously.
+
+        Runs the synchronous fetch in a worker thread so several
+        handlers' lists can be gathered concurrently.
+
+        Returns:
+            List of model names or empty list if error
+        """
+        return await asyncio.to_thread(self.get_available_models)
+
+    def get_response_stream(self, prompt):
+        """Get a response as an iterator of text chunks.
+
+        Subclasses with native streaming support should override this so
+        the first tokens can be displayed while the rest are still being
+        generated; the default yields the complete response in a single
+        chunk.
+
+        Args:
+            prompt: The user's message to send to the API
+
+        Yields:
+            Chunks of the AI's response text
+        """
+        yield self.get_response(prompt)
+
+    def _estimate_tokens(self, content):
+        """Estimate the token cost of a message content string.
+
+        Args:
+            content: The message content
+
+        Returns:
+            Approximate token count
+        """
+        return len(content) // self.CHARS_PER_TOKEN + 4
+
+    def _windowed_history(self, history=None):
+        """Get the most recent messages that fit the history budget.
+
+        Request size otherwise grows linearly with conversation length,
+        so every handler sends this window instead of the full
+        transcript. The stored history is never truncated; only the
+        slice sent to the API is.
+
+        Args:
+            history: The message list to window (defaults to the
+                conversation history)
+
+        Returns:
+            The most recent messages within max_history_messages and
+            max_history_tokens, with the newest message and the opening
+            message always kept, or the full list when everything fits
+        """
+        if history is None:
+            history = self.conversation_history
+            # Fast path: the running token total tracks this list, so
+            # when the whole history fits both budgets the tail scan is
+            # skipped entirely
+            if (self._approx_tokens <= self.max_history_tokens
+                    and (not self.max_history_messages
+                         or len(history) <= self.max_history_messages)):
+                return history
+        if not history:
+            return history
+
+        # The newest message is always kept, even when it alone blows
+        # the budget: it is the turn being asked about, and omitting it
+        # would desync the reply from the recorded history
+        start = len(history) - 1
+        if self.max_history_tokens:
+            total = self._estimate_tokens(history[start]["content"])
+            for i in range(len(history) - 2, -1, -1):
+                total += self._estimate_tokens(history[i]["content"])
+                if total > self.max_history_tokens:
+                    break
+                start = i
+        else:
+            start = 0
+        # The message cap shares the kept-head treatment below instead
+        # of slicing the opening message away with the rest of the tail
+        if self.max_history_messages:
+            start = max(start, len(history) - self.max_history_messages)
+        if start == 0:
+            return history
+
+        # Open the window on a user turn (never giving up the newest
+        # message); starting mid-exchange would put an assistant message
+        # right after the kept head, which strict-alternation APIs
+        # reject
+        while start < len(history) - 1 and history[start]["role"] != "user":
+            start += 1
+
+        # Keep the opening message so the conversation's anchor (and
+        # the stable prefix it heads) is never dropped; a summarizer,
+        # when configured, bridges the dropped middle
+        window = history[start:]
+        summary = self._summarize_middle(history, start)
+        if summary is not None:
+            return [history[0], summary, *window]
+        return [history[0], *window]
+
+    def _summarize_middle(self, history, start):
+        """Summarize the turns dropped by the history window.
+
+        The summary is produced once per window position through the
+        injected summarizer and cached, so the extra model call is not
+        repeated on every turn.
+
+        Args:
+            history: The full message list being windowed
+            start: Index of the first message kept by the window
+
+        Returns:
+            A system message bridging the dropped middle, or None when
+            no summarizer is configured or nothing was dropped. The
+            OpenAI-style handlers send it as-is; handlers whose APIs
+            reject system roles mid-conversation remap it when building
+            the request
+        """
+        if self.summarizer is None or start <= 1:
+            return None
+        if self._middle_summary is None or self._middle_summary[0] != start:
+            text = self.summarizer(history[1:start])
+            self._middle_summary = (start, {"role": "system", "content": text})
+        return self._middle_summary[1]
+
+    def get_conversation_page(self, offset, limit):
+        """Get a page of the conversation history.
+
+        Lets callers (e.g. a context viewer) pull the transcript in
+        chunks instead of materializing the whole list at once.
+
+        Args:
+            offset: Index of the first message to return
+            limit: Maximum number of messages to return
+
+        Returns:
+            List of messages in the requested range
+        """
+        return self.conversation_history[offset:offset + limit]
+
+    def _cache_key(self, prompt):
+        """Compute the cache key for a prompt in the current context.
+
+        Args:
+            prompt: The user's message
+
+        Returns:
+            Hex digest covering model, system prompt, history and prompt
+        """
+        state = json.dumps(
+            [self.selected_model, self.system_prompt, self.conversation_history, prompt]
+        )
+        return hashlib.blake2b(state.encode()).hexdigest()
+
+    def _cache_get(self, key, prompt):
+        """Look up a cached response and replay it into the history.
+
+        Args:
+            key: The cache key from _cache_key
+            prompt: The user's message, recorded on a hit
+
+        Returns:
+            The cached response text, or None on a miss
+        """
+        if not self.cache_enabled:
+            return None
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+        else:
+            if self.disk_cache is not None:
+                cached = self.disk_cache.get(key)
+            if cached is None and self.semantic_cache is not None:
+                cached = self.semantic_cache.lookup(prompt)
+        if cached is None:
+            return None
+        self.cache_hits += 1
+        self.record_message("user", prompt)
+        self.record_message("assistant", cached)
+        if self.logger:
+            self.logger.log("Response served from cache", self.__class__.__name__)
+        return cached
+
+    def _cache_put(self, key, response, prompt=None):
+        """Store a successful response in the cache.
+
+        Args:
+            key: The cache key from _cache_key
+            response: The response text to store
+            prompt: The user's message, used for semantic storage
+        """
+        if not self.cache_enabled or response.startswith("Error"):
+            return
+        self._response_cache[key] = response
+        if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        if self.disk_cache is not None:
+            self.disk_cache.put(key, response)
+        if self.semantic_cache is not None and prompt is not None:
+            self.semantic_cache.store(prompt, response)
+
+    def _pop_failed_turn(self):
+        """Drop the user turn recorded for a request that failed.
+
+        Handlers append the user message to the history before issuing
+        the request; a failed call would otherwise leave that message
+        with no assistant reply, desynchronizing every later request
+        (and its cache key) from the actual transcript.
+        """
+        if self.conversation_history and self.conversation_history[-1]["role"] == "user":
+            dropped = self.conversation_history.pop()
+            self._approx_tokens -= self._estimate_tokens(dropped["content"])
+
     def clear_conversation_history(self):
         """Clear the conversation history."""
         self.conversation_history = []
+        self._approx_tokens = 0
+        self._middle_summary = None
         if self.logger:
             self.logger.log("Conversation history cleared", self.__class__.__name__)
     
     def get_conversation_history(self):
         """Get the current conversation history.
-        
+
         Returns:
-            List of conversation messages including system prompt
+            Iterable of conversation messages including the system
+            prompt, chained lazily so no copy of the history is made
         """
-        # Create a full history including the system prompt
-        full_history = []
         if self.system_prompt:
-            full_history.append({"role": "system", "content": self.system_prompt})
-        full_history.extend(self.conversation_history)
-        return full_history
+            return itertools.chain(
+                [{"role": "system", "content": self.system_prompt}],
+                self.conversation_history
+            )
+        return self.conversation_history
     
     def get_conversation_length(self):
         """Get the number of messages in the conversation history.
@@ -109,4 +572,6 @@ class APIHandler(ABC):
             self.logger.log(f"Error: {message}", "Error")
         # Only show error message box if it's not during initialization
         if self.logger and hasattr(self.logger, 'initialized') and self.logger.initialized:
+            # Imported here so the module stays usable in headless contexts
+            from tkinter import messagebox
             messagebox.showerror(f"{self.__class__.__name__} Error", message)
@@ -13,15 +13,35 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-import google.generativeai as genai
-from api_handler import APIHandler
+import time
+
+from api_handler import APIHandler, cached_response, cached_stream
+
+# Imported lazily so the app doesn't pay the SDK's import cost (grpc,
+# protobuf) unless a Gemini handler is actually configured
+_genai = None
+
+def _load_genai():
+    """Import and cache the google.generativeai module.
+
+    Returns:
+        The google.generativeai module
+    """
+    global _genai
+    if _genai is None:
+        import google.generativeai as genai
+        _genai = genai
+    return _genai
 
 class GeminiHandler(APIHandler):
     """Handler for Google Gemini API interactions."""
-    
+
+    # Seconds before the fetched model list is considered stale
+    MODELS_CACHE_TTL = 300
+
     def __init__(self, logger, api_key=None):
         """Initialize the Gemini handler.
-        
+
         Args:
             logger: The logger instance
             api_key: The Gemini API key
@@ -29,6 +49,8 @@ class GeminiHandler(APIHandler):
         super().__init__(logger)
         self.api_key = api_key
         self.client = None
+        self._models_cache = None
+        self._models_cache_ts = 0
         if api_key:
             self.set_api_key(api_key)
     
@@ -39,7 +61,9 @@ class GeminiHandler(APIHandler):
             api_key: The Gemini API key
         """
         self.api_key = api_key
+        self._models_cache = None
         try:
+            genai = _load_genai()
             genai.configure(api_key=api_key)
             self.client = genai
             if self.logger:
@@ -56,10 +80,18 @@ class GeminiHandler(APIHandler):
         if not self.api_key or not self.client:
             self._show_error("API key not set. Please set your Gemini API key.")
             return []
-            
+
+        # Serve the cached list while it's fresh; each fetch is a full
+        # network round-trip and the catalog rarely changes mid-session
+        if (self._models_cache
+                and time.monotonic() - self._models_cache_ts < self.MODELS_CACHE_TTL):
+            return self._models_cache
+
         try:
-            models = [model.name for model in self.client.list_models() 
+            models = [model.name for model in self.client.list_models()
                      if "gemini" in model.name]
+            self._models_cache = models
+            self._models_cache_ts = time.monotonic()
             if self.logger:
                 self.logger.log(f"Loaded {len(models)} Gemini models", "Gemini")
             return models
@@ -71,64 +103,174 @@ class GeminiHandler(APIHandler):
                 self.logger.log(f"Using fallback list of {len(models)} Gemini models", "Gemini")
             return models
     
-    def get_response(self, prompt):
-        """Get a response from Gemini for the given prompt.
-        
-        Args:
-            prompt: The user's message to send to Gemini
-            
+    def _check_ready(self):
+        """Check that the handler can issue a request.
+
         Returns:
-            The AI's response text
+            An error message string, or None if ready
         """
         if not self.api_key or not self.client:
             if self.logger:
                 self.logger.log("API key not set", "Error")
             return "Error: Gemini API key not set"
-            
+
         if not self.selected_model:
             if self.logger:
                 self.logger.log("No model selected", "Error")
             return "Error: No model selected"
-        
-        # Convert conversation history to Gemini format
+        return None
+
+    def _start_chat(self):
+        """Create a chat session seeded with the conversation history.
+
+        Only the windowed slice is converted to Gemini's format, so the
+        per-turn conversion cost is bounded by the window size rather
+        than the transcript length, and non-contiguous windows (kept
+        head, summary bridge) are handled naturally.
+
+        Returns:
+            A Gemini chat session
+        """
         history = []
-        
-        # Add conversation history
-        for msg in self.conversation_history:
-            role = msg["role"]
-            content = msg["content"]
-            if role == "user":
-                history.append({"role": "user", "parts": [content]})
-            elif role == "assistant":
-                history.append({"role": "model", "parts": [content]})
-        
+        for msg in self._windowed_history():
+            role = "model" if msg["role"] == "assistant" else "user"
+            if history and history[-1]["role"] == role:
+                # Gemini requires strict user/model alternation, so the
+                # kept head or summary bridge is folded into the next
+                # same-role message
+                history[-1]["parts"].append(msg["content"])
+            else:
+                history.append({"role": role, "parts": [msg["content"]]})
+        model = self.client.GenerativeModel(self.selected_model)
+        return model.start_chat(history=history)
+
+    def _record_turn(self, prompt, assistant_response):
+        """Record a completed turn in the conversation history.
+
+        Args:
+            prompt: The user's message
+            assistant_response: The AI's response text
+        """
+        self.record_message("user", prompt)
+        self.record_message("assistant", assistant_response)
+
+    @cached_response
+    def get_response(self, prompt):
+        """Get a response from Gemini for the given prompt.
+
+        Args:
+            prompt: The user's message to send to Gemini
+
+        Returns:
+            The AI's response text
+        """
+        error = self._check_ready()
+        if error:
+            return error
+
         try:
             if self.logger:
                 self.logger.log(f"Sending prompt to {self.selected_model}", "Gemini")
-            
-            # Initialize the model
-            model = self.client.GenerativeModel(self.selected_model)
-            
-            # Create a chat session
-            chat = model.start_chat(history=history)
-            
+
+            chat = self._start_chat()
+
             # Add system prompt if available
             generation_config = {}
             if self.system_prompt:
                 generation_config["system_instruction"] = self.system_prompt
-            
+
             # Send the prompt and get response
             response = chat.send_message(
                 prompt,
                 generation_config=generation_config if self.system_prompt else None
             )
-            
+
+            assistant_response = response.text
+            self._record_turn(prompt, assistant_response)
+            return assistant_response
+        except Exception as e:
+            if self.logger:
+                self.logger.log(f"Error generating response: {str(e)}", "Error")
+            self._show_error(f"Gemini API error: {str(e)}")
+            return f"Error: Could not generate response - {str(e)}"
+
+    @cached_stream
+    def get_response_stream(self, prompt):
+        """Get a response from Gemini as a stream of text chunks.
+
+        Args:
+            prompt: The user's message to send to Gemini
+
+        Yields:
+            Chunks of the AI's response text
+        """
+        error = self._check_ready()
+        if error:
+            yield error
+            return
+
+        try:
+            if self.logger:
+                self.logger.log(f"Streaming prompt to {self.selected_model}", "Gemini")
+
+            chat = self._start_chat()
+
+            generation_config = {}
+            if self.system_prompt:
+                generation_config["system_instruction"] = self.system_prompt
+
+            response = chat.send_message(
+                prompt,
+                stream=True,
+                generation_config=generation_config if self.system_prompt else None
+            )
+
+            parts = []
+            for chunk in response:
+                text = chunk.text
+                if text:
+                    parts.append(text)
+                    yield text
+
+            self._record_turn(prompt, "".join(parts))
+        except Exception as e:
+            if self.logger:
+                self.logger.log(f"Error generating response: {str(e)}", "Error")
+            self._show_error(f"Gemini API error: {str(e)}")
+            yield f"Error: Could not generate response - {str(e)}"
+
+    @cached_response
+    async def aget_response(self, prompt):
+        """Get a response from Gemini asynchronously.
+
+        Args:
+            prompt: The user's message to send to Gemini
+
+        Returns:
+            The AI's response text
+        """
+        error = self._check_ready()
+        if error:
+            return error
+
+        try:
+            if self.logger:
+                self.logger.log(f"Sending prompt to {self.selected_model}", "Gemini")
+
+            chat = self._start_chat()
+
+            generation_config = {}
+            if self.system_prompt:
+                generation_config["system_instruction"] = self.system_prompt
+
+            async with self._request_semaphore:
+                response = await chat.send_message_async(
+                    prompt,
+                    generation_config=generation_config if self.system_prompt else None
+                )
+
             assistant_response = response.text
-            
-            # Add to conversation history
-            self.conversation_history.append({"role": "user", "content": prompt})
-            self.conversation_history.append({"role": "assistant", "content": assistant_response})
-            
+            self._record_turn(prompt, assistant_response)
             return assistant_response
         except Exception as e:
             if self.logger:
@@ -13,33 +13,109 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
+import json
+
+import httpx
 import requests
-from api_handler import APIHandler
+from requests.adapters import HTTPAdapter, Retry
+from api_handler import APIHandler, cached_response, cached_stream, run_coroutine
+
+# orjson serializes the message payloads several times faster than the
+# stdlib; fall back to json when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_dumps(payload):
+    """Serialize a request payload to JSON bytes.
+
+    Args:
+        payload: The payload dict to serialize
+
+    Returns:
+        The JSON-encoded bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+def _json_loads(data):
+    """Deserialize JSON bytes or text.
+
+    Args:
+        data: The JSON bytes or string to parse
+
+    Returns:
+        The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class GrokHandler(APIHandler):
     """Handler for Grok API interactions."""
-    
-    def __init__(self, logger, api_key=None):
+
+    # (connect, read) timeouts for chat completion requests
+    REQUEST_TIMEOUT = (3.05, 30)
+
+    # Maximum prompts dispatched concurrently per batch chunk
+    BATCH_CHUNK_SIZE = 100
+
+    def __init__(self, logger, api_key=None, session=None):
         """Initialize the Grok handler.
-        
+
         Args:
             logger: The logger instance
             api_key: The Grok API key
+            session: Optional shared requests.Session; a pooled one is
+                created when not provided
         """
         super().__init__(logger)
         self.api_key = api_key
         self.api_base = "https://api.grok.x.com/v1"
-        
+        self._async_client = None
+        # Reuse one session across calls so repeated requests share a
+        # pooled keep-alive connection instead of paying a TCP+TLS
+        # handshake per prompt
+        if session is not None:
+            self._session = session
+        else:
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            ))
+
+    def _get_async_client(self):
+        """Get the cached async client, creating it on first use.
+
+        The client persists across calls so repeated async requests
+        share pooled keep-alive connections, and it carries the same
+        connect/read timeouts as the sync session rather than httpx's
+        5-second default, which normal-length completions exceed.
+
+        Returns:
+            The shared httpx.AsyncClient
+        """
+        if self._async_client is None:
+            connect, read = self.REQUEST_TIMEOUT
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(read, connect=connect))
+        return self._async_client
+
     def set_api_key(self, api_key):
         """Set the Grok API key.
-        
+
         Args:
             api_key: The Grok API key
         """
         self.api_key = api_key
         if self.logger:
             self.logger.log("Grok API key set", "Grok")
-    
+
     def get_available_models(self):
         """Get a list of available Grok models.
         
@@ -56,71 +132,267 @@ class GrokHandler(APIHandler):
             self.logger.log(f"Loaded {len(models)} Grok models", "Grok")
         return models
     
-    def get_response(self, prompt):
-        """Get a response from Grok for the given prompt.
-        
-        Args:
-            prompt: The user's message to send to Grok
-            
+    def _check_ready(self):
+        """Check that the handler can issue a request.
+
         Returns:
-            The AI's response text
+            An error message string, or None if ready
         """
         if not self.api_key:
             if self.logger:
                 self.logger.log("API key not set", "Error")
             return "Error: Grok API key not set"
-            
+
         if not self.selected_model:
             if self.logger:
                 self.logger.log("No model selected", "Error")
             return "Error: No model selected"
-        
-        # Create messages list with system prompt if available
-        messages = []
-        if self.system_prompt:
-            messages.append({"role": "system", "content": self.system_prompt})
-        
-        # Add conversation history
-        messages.extend(self.conversation_history)
-        
-        # Add current prompt
-        self.conversation_history.append({"role": "user", "content": prompt})
-        messages.append({"role": "user", "content": prompt})
-        
+        return None
+
+    def _build_request(self, messages):
+        """Build the headers and payload for a chat completion request.
+
+        Args:
+            messages: The messages list to send
+
+        Returns:
+            Tuple of (headers, payload)
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        payload = {
+            "model": self.selected_model,
+            "messages": messages,
+            "max_tokens": 1024
+        }
+        return headers, payload
+
+    @cached_response
+    def get_response(self, prompt):
+        """Get a response from Grok for the given prompt.
+
+        Args:
+            prompt: The user's message to send to Grok
+
+        Returns:
+            The AI's response text
+        """
+        error = self._check_ready()
+        if error:
+            return error
+
+        messages = self._build_messages(prompt)
+
         try:
             if self.logger:
                 self.logger.log(f"Sending prompt to {self.selected_model}", "Grok")
-            
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "model": self.selected_model,
-                "messages": messages,
-                "max_tokens": 1024
-            }
-            
-            response = requests.post(
+
+            headers, payload = self._build_request(messages)
+
+            response = self._session.post(
                 f"{self.api_base}/chat/completions",
                 headers=headers,
-                json=payload
+                data=_json_dumps(payload),
+                timeout=self.REQUEST_TIMEOUT
             )
-            
+
             if response.status_code != 200:
+                self._pop_failed_turn()
                 error_msg = f"Grok API error: {response.status_code} - {response.text}"
                 if self.logger:
                     self.logger.log(error_msg, "Error")
                 return f"Error: {error_msg}"
-            
-            response_data = response.json()
+
+            response_data = _json_loads(response.content)
             assistant_response = response_data["choices"][0]["message"]["content"]
-            self.conversation_history.append(
-                {"role": "assistant", "content": assistant_response}
+            self.record_message("assistant", assistant_response)
+            return assistant_response
+        except Exception as e:
+            self._pop_failed_turn()
+            if self.logger:
+                self.logger.log(f"Error generating response: {str(e)}", "Error")
+            self._show_error(f"Grok API error: {str(e)}")
+            return f"Error: Could not generate response - {str(e)}"
+
+    @cached_stream
+    def get_response_stream(self, prompt):
+        """Get a response from Grok as a stream of text chunks.
+
+        Args:
+            prompt: The user's message to send to Grok
+
+        Yields:
+            Chunks of the AI's response text
+        """
+        error = self._check_ready()
+        if error:
+            yield error
+            return
+
+        messages = self._build_messages(prompt)
+
+        try:
+            if self.logger:
+                self.logger.log(f"Streaming prompt to {self.selected_model}", "Grok")
+
+            headers, payload = self._build_request(messages)
+            payload["stream"] = True
+
+            response = self._session.post(
+                f"{self.api_base}/chat/completions",
+                headers=headers,
+                data=_json_dumps(payload),
+                stream=True,
+                timeout=self.REQUEST_TIMEOUT
             )
+
+            if response.status_code != 200:
+                self._pop_failed_turn()
+                error_msg = f"Grok API error: {response.status_code} - {response.text}"
+                if self.logger:
+                    self.logger.log(error_msg, "Error")
+                yield f"Error: {error_msg}"
+                return
+
+            # Parse the SSE stream; each data line carries one delta
+            parts = []
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                line = line.decode()
+                if not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    break
+                delta = _json_loads(data)["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    yield delta
+
+            self.record_message("assistant", "".join(parts))
+        except Exception as e:
+            self._pop_failed_turn()
+            if self.logger:
+                self.logger.log(f"Error generating response: {str(e)}", "Error")
+            self._show_error(f"Grok API error: {str(e)}")
+            yield f"Error: Could not generate response - {str(e)}"
+
+    def get_responses_batch(self, prompts):
+        """Get responses for several independent prompts concurrently.
+
+        The Grok API does not accept multiple completions per request,
+        so the prompts are dispatched concurrently over one async client
+        in chunks, which amortizes connection setup across the batch.
+        Each prompt is sent standalone with the system prompt but no
+        conversation history, and nothing is recorded in the history.
+
+        Args:
+            prompts: List of independent prompts
+
+        Returns:
+            List of response texts, in prompt order
+        """
+        error = self._check_ready()
+        if error:
+            return [error] * len(prompts)
+        return run_coroutine(self._gather_batch(prompts))
+
+    async def _gather_batch(self, prompts):
+        """Dispatch batch prompts in chunks over a shared async client.
+
+        Args:
+            prompts: List of independent prompts
+
+        Returns:
+            List of response texts, in prompt order
+        """
+        results = []
+        client = self._get_async_client()
+        for start in range(0, len(prompts), self.BATCH_CHUNK_SIZE):
+            chunk = prompts[start:start + self.BATCH_CHUNK_SIZE]
+            results.extend(await asyncio.gather(
+                *(self._apost_single(client, prompt) for prompt in chunk)
+            ))
+        return results
+
+    async def _apost_single(self, client, prompt):
+        """Send one standalone prompt over the given async client.
+
+        Args:
+            client: The httpx.AsyncClient to post with
+            prompt: The prompt to send
+
+        Returns:
+            The AI's response text
+        """
+        messages = [*self._prefix, {"role": "user", "content": prompt}]
+        headers, payload = self._build_request(messages)
+
+        try:
+            async with self._request_semaphore:
+                response = await client.post(
+                    f"{self.api_base}/chat/completions",
+                    headers=headers,
+                    content=_json_dumps(payload)
+                )
+
+            if response.status_code != 200:
+                error_msg = f"Grok API error: {response.status_code} - {response.text}"
+                if self.logger:
+                    self.logger.log(error_msg, "Error")
+                return f"Error: {error_msg}"
+
+            return _json_loads(response.content)["choices"][0]["message"]["content"]
+        except Exception as e:
+            if self.logger:
+                self.logger.log(f"Error generating response: {str(e)}", "Error")
+            return f"Error: Could not generate response - {str(e)}"
+
+    @cached_response
+    async def aget_response(self, prompt):
+        """Get a response from Grok asynchronously.
+
+        Args:
+            prompt: The user's message to send to Grok
+
+        Returns:
+            The AI's response text
+        """
+        error = self._check_ready()
+        if error:
+            return error
+
+        messages = self._build_messages(prompt)
+
+        try:
+            if self.logger:
+                self.logger.log(f"Sending prompt to {self.selected_model}", "Grok")
+
+            headers, payload = self._build_request(messages)
+
+            async with self._request_semaphore:
+                response = await self._get_async_client().post(
+                    f"{self.api_base}/chat/completions",
+                    headers=headers,
+                    content=_json_dumps(payload)
+                )
+
+            if response.status_code != 200:
+                self._pop_failed_turn()
+                error_msg = f"Grok API error: {response.status_code} - {response.text}"
+                if self.logger:
+                    self.logger.log(error_msg, "Error")
+                return f"Error: {error_msg}"
+
+            response_data = _json_loads(response.content)
+            assistant_response = response_data["choices"][0]["message"]["content"]
+            self.record_message("assistant", assistant_response)
             return assistant_response
         except Exception as e:
+            self._pop_failed_turn()
             if self.logger:
                 self.logger.log(f"Error generating response: {str(e)}", "Error")
             self._show_error(f"Grok API error: {str(e)}")
@@ -106,13 +106,22 @@ class GUIComponents:
         label.pack(side=side, padx=padx, pady=pady)
         return label
     
+    # Messages pulled per page while filling a context viewer
+    CONTEXT_PAGE_SIZE = 200
+
     @staticmethod
-    def create_context_viewer(parent, conversation_history, title="Conversation Context"):
+    def create_context_viewer(parent, fetch_page, title="Conversation Context"):
         """Create a window to view conversation context.
-        
+
+        The transcript is pulled through fetch_page one page at a time,
+        each page inserted as a single string between Tk events, so the
+        window opens immediately and fills progressively instead of
+        materializing and laying out the whole history up front.
+
         Args:
             parent: The parent widget
-            conversation_history: The conversation history to display
+            fetch_page: Callable taking (offset, limit) and returning
+                the list of messages in that range
             title: The window title
         """
         context_window = tk.Toplevel(parent)
@@ -121,13 +130,25 @@ class GUIComponents:
         
         context_text = tk.Text(context_window, wrap='word', padx=10, pady=10)
         context_text.pack(fill='both', expand=True)
-        
-        for msg in conversation_history:
-            role = msg["role"].capitalize()
-            content = msg["content"]
-            context_text.insert('end', f"{role}: {content}\n\n")
-        
         context_text.config(state='disabled')
+
+        page_size = GUIComponents.CONTEXT_PAGE_SIZE
+
+        def load_page(offset):
+            if not context_window.winfo_exists():
+                return
+            page = fetch_page(offset, page_size)
+            if page:
+                context_text.config(state='normal')
+                context_text.insert('end', ''.join(
+                    f"{msg['role'].capitalize()}: {msg['content']}\n\n"
+                    for msg in page
+                ))
+                context_text.config(state='disabled')
+            if len(page) >= page_size:
+                context_window.after_idle(load_page, offset + page_size)
+
+        load_page(0)
         
         # Add copy button
         def copy_to_clipboard():
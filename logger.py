@@ -14,37 +14,69 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import tkinter as tk
-import datetime
+import collections
+import time
 
 class GUILogger:
     """Logger class that writes to a tkinter Text widget."""
-    
+
     def __init__(self, text_widget):
         """Initialize the logger with a tkinter Text widget.
-        
+
         Args:
             text_widget: A tkinter Text widget where logs will be displayed
         """
         self.text_widget = text_widget
         self.initialized = False
-    
+        self.max_lines = 5000
+        self._last_ts_second = 0
+        self._last_ts_str = ""
+        self._pending = collections.deque()
+        self._flush_scheduled = False
+
     def log(self, message, source="System"):
         """Log a message to the text widget.
-        
+
+        Messages are buffered and flushed in one insert per idle cycle,
+        so chatty sources don't pay a widget relayout per message.
+
         Args:
             message: The message to log
             source: The source of the message (default: "System")
         """
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {source}: {message}\n"
-        self.text_widget.insert('end', formatted_message)
-        self.text_widget.see('end')
-        
+        # Re-format the timestamp only when the second changes; bursts
+        # of messages within the same second reuse the cached string
+        now = int(time.time())
+        if now != self._last_ts_second:
+            self._last_ts_second = now
+            self._last_ts_str = time.strftime("%H:%M:%S")
+        self._pending.append(f"[{self._last_ts_str}] {source}: {message}\n")
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.text_widget.after_idle(self._flush)
+
         # Mark as initialized after first log message
         if not self.initialized:
             self.initialized = True
-    
+
+    def _flush(self):
+        """Flush all pending messages to the text widget in one insert."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        self.text_widget.insert('end', ''.join(self._pending))
+        self._pending.clear()
+
+        # Trim oldest lines so a long-running session doesn't grow the
+        # widget (and its B-tree) without bound
+        lines = int(self.text_widget.index('end-1c').split('.')[0])
+        if lines > self.max_lines:
+            self.text_widget.delete('1.0', f'{lines - self.max_lines}.0')
+
+        self.text_widget.see('end')
+
     def clear(self):
         """Clear all logs from the text widget."""
+        self._pending.clear()
         self.text_widget.delete(1.0, 'end')
         self.log("Log cleared")
@@ -18,15 +18,50 @@ from tkinter import ttk, messagebox
 import platform
 import os
 import time
+import asyncio
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import dotenv
+import requests
+from requests.adapters import HTTPAdapter
 from logger import GUILogger
 from api_factory import APIFactory
 from gui_components import GUIComponents
 
+# Shared worker pool for API calls and the conversation loop, so Tk
+# callbacks never block on network I/O
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Environment parsed once at import: .env values overlaid by the real
+# environment, so constructors do dict lookups instead of disk I/O
+_ENV = {**dotenv.dotenv_values(), **os.environ}
+
+# Supported provider names, in the order the comboboxes offer them
+_API_TYPES = ("ollama", "openai", "anthropic", "grok", "gemini")
+
+# Placeholder shown in the key entries for keys loaded from the
+# environment; edits are tracked by flag, not by comparing against it
+_MASK = "*" * 12
+
 class DualAgentChatGUI:
     """Main application class for the Dual Agent Chat GUI."""
-    
+
+    # Maximum lines kept in the conversation widget; the full
+    # transcript lives in self._transcript
+    MAX_CONV_LINES = 2000
+
+    # Per-provider constructor kwargs, read from the current instance
+    # state; replaces the api_type if/elif ladders that used to be
+    # duplicated for each agent in __init__ and apply_api_settings
+    _KWARG_BUILDERS = {
+        "ollama": lambda s: {"address": s.ollama_address, "session": s._http},
+        "openai": lambda s: {"api_key": s._secrets["openai"]},
+        "anthropic": lambda s: {"api_key": s._secrets["anthropic"]},
+        "grok": lambda s: {"api_key": s._secrets["grok"], "session": s._http},
+        "gemini": lambda s: {"api_key": s._secrets["gemini"]},
+    }
+
     def __init__(self, root):
         """Initialize the application.
         
@@ -37,60 +72,70 @@ class DualAgentChatGUI:
         self.root.title("Multi Agent Chat")
         self.root.geometry("800x800")
         
-        # Load environment variables
-        dotenv.load_dotenv()
-        
         # Initialize logger to None first
         self.logger = None
         
         # State variables
         self.conversation_started = False
-        self.conversation_thread = None
-        self.stop_conversation = False
+        self.conversation_future = None
         self.max_turns = 10
         self.current_turn = 0
         self.turn_delay = 2  # seconds between turns
+        self.history_window = 12  # messages sent per request (0 = all)
         self.default_prompt = "Hello, let's have a conversation."
         self.default_system_prompt1 = "You are a helpful AI assistant."
         self.default_system_prompt2 = "You are a helpful AI assistant."
-        self.ollama_address = os.getenv("OLLAMA_ADDRESS", "http://localhost:11434")
+        self.ollama_address = _ENV.get("OLLAMA_ADDRESS", "http://localhost:11434")
         self.agent1_name = "Agent 1"
         self.agent2_name = "Agent 2"
-        self.api_type1 = os.getenv("DEFAULT_API_TYPE1", "ollama")
-        self.api_type2 = os.getenv("DEFAULT_API_TYPE2", "ollama")
-        self.openai_api_key = os.getenv("OPENAI_API_KEY", "")
-        self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY", "")
-        self.grok_api_key = os.getenv("GROK_API_KEY", "")
-        self.gemini_api_key = os.getenv("GEMINI_API_KEY", "")
-        
+        # Model lists fetched per provider endpoint, so re-applying
+        # settings that don't change the endpoint skips the round trip
+        self._models_by_key = {}
+        # Full conversation transcript; the widget only shows a capped
+        # tail of it
+        self._transcript = []
+        self._last_apply_key1 = None
+        self._last_apply_key2 = None
+        self.api_type1 = _ENV.get("DEFAULT_API_TYPE1", "ollama")
+        self.api_type2 = _ENV.get("DEFAULT_API_TYPE2", "ollama")
+        # API keys live in one secrets store, read from the environment
+        # once; everything else references it instead of keeping copies
+        self._secrets = {
+            "openai": _ENV.get("OPENAI_API_KEY", ""),
+            "anthropic": _ENV.get("ANTHROPIC_API_KEY", ""),
+            "grok": _ENV.get("GROK_API_KEY", ""),
+            "gemini": _ENV.get("GEMINI_API_KEY", ""),
+        }
+        
+        # UI updates from worker threads and the conversation loop are
+        # queued and applied in batches on the Tk main thread; Tk is not
+        # thread-safe, so widgets are never touched cross-thread
+        self._ui_queue = queue.Queue()
+        self._ctx_update_pending = False
+
         # Setup GUI components
         self.setup_gui()
-        
+        self.root.after(30, self._drain_ui_queue)
+
+        # Background asyncio loop on its own thread; the conversation
+        # coroutine runs here so awaits (API calls, turn delays) never
+        # block the Tk main loop
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        # Stop requests are delivered through an event on that loop, so
+        # a running delay can be interrupted instead of polled
+        self._stop_event = asyncio.Event()
+
+        # One pooled HTTP session shared by both agents' handlers, so
+        # consecutive turns reuse warm keep-alive connections
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+
         # Initialize handlers for two agents with appropriate parameters
-        kwargs1 = {}
-        kwargs2 = {}
-        
-        if self.api_type1 == "ollama":
-            kwargs1["address"] = self.ollama_address
-        elif self.api_type1 == "openai":
-            kwargs1["api_key"] = self.openai_api_key
-        elif self.api_type1 == "anthropic":
-            kwargs1["api_key"] = self.anthropic_api_key
-        elif self.api_type1 == "grok":
-            kwargs1["api_key"] = self.grok_api_key
-        elif self.api_type1 == "gemini":
-            kwargs1["api_key"] = self.gemini_api_key
-            
-        if self.api_type2 == "ollama":
-            kwargs2["address"] = self.ollama_address
-        elif self.api_type2 == "openai":
-            kwargs2["api_key"] = self.openai_api_key
-        elif self.api_type2 == "anthropic":
-            kwargs2["api_key"] = self.anthropic_api_key
-        elif self.api_type2 == "grok":
-            kwargs2["api_key"] = self.grok_api_key
-        elif self.api_type2 == "gemini":
-            kwargs2["api_key"] = self.gemini_api_key
+        kwargs1 = self._KWARG_BUILDERS[self.api_type1](self)
+        kwargs2 = self._KWARG_BUILDERS[self.api_type2](self)
         
         self.agent1 = APIFactory.create_handler(self.api_type1, self.logger, **kwargs1)
         self.agent2 = APIFactory.create_handler(self.api_type2, self.logger, **kwargs2)
@@ -98,6 +143,38 @@ class DualAgentChatGUI:
         # Load initial data
         self.refresh_models()
 
+        # Warm connections in the background so the first turn doesn't
+        # pay the TCP+TLS handshake
+        threading.Thread(target=self._warm_connections, daemon=True).start()
+
+    def _warm_connections(self):
+        """Pre-warm connections to the configured provider endpoints.
+
+        Issues a HEAD request per configured provider on a daemon
+        thread at startup. For the requests-based providers the pooled
+        session keeps the socket, so turn 1 reuses it; for SDK-managed
+        providers this still primes DNS and the OS TLS session cache.
+        Failures are ignored — warm-up is best effort and any real
+        connectivity problem surfaces on the first actual request.
+        """
+        endpoints = {
+            "ollama": self.ollama_address,
+            "openai": "https://api.openai.com",
+            "anthropic": "https://api.anthropic.com",
+            "gemini": "https://generativelanguage.googleapis.com",
+        }
+        for api_type, agent in {self.api_type1: self.agent1,
+                                self.api_type2: self.agent2}.items():
+            # Prefer the handler's own endpoint so the warmed socket is
+            # the one its requests will actually reuse
+            endpoint = getattr(agent, "api_base", None) or endpoints.get(api_type)
+            if not endpoint:
+                continue
+            try:
+                self._http.head(endpoint, timeout=3)
+            except requests.RequestException:
+                pass
+
     def setup_gui(self):
         """Set up the GUI components."""
         # Create main notebook with tabs
@@ -137,7 +214,7 @@ class DualAgentChatGUI:
         api_type_label1 = ttk.Label(api_type_frame1, text="Agent 1 API Type:")
         api_type_label1.pack(side='left')
         
-        self.api_type_combo1 = ttk.Combobox(api_type_frame1, values=["ollama", "openai", "anthropic", "grok", "gemini"], state="readonly")
+        self.api_type_combo1 = ttk.Combobox(api_type_frame1, values=_API_TYPES, state="readonly")
         self.api_type_combo1.pack(side='left', padx=5)
         self.api_type_combo1.set(self.api_type1)
         self.api_type_combo1.bind("<<ComboboxSelected>>", lambda e: self.update_api_settings_visibility())
@@ -149,78 +226,101 @@ class DualAgentChatGUI:
         api_type_label2 = ttk.Label(api_type_frame2, text="Agent 2 API Type:")
         api_type_label2.pack(side='left')
         
-        self.api_type_combo2 = ttk.Combobox(api_type_frame2, values=["ollama", "openai", "anthropic", "grok", "gemini"], state="readonly")
+        self.api_type_combo2 = ttk.Combobox(api_type_frame2, values=_API_TYPES, state="readonly")
         self.api_type_combo2.pack(side='left', padx=5)
         self.api_type_combo2.set(self.api_type2)
         self.api_type_combo2.bind("<<ComboboxSelected>>", lambda e: self.update_api_settings_visibility())
-        
+
+        # Container for the per-provider rows, laid out with grid so
+        # toggling visibility is grid_remove/grid (which keeps the
+        # cached geometry) instead of a full pack reflow
+        provider_frame = ttk.Frame(connection_frame)
+        provider_frame.pack(fill='x')
+        provider_frame.columnconfigure(0, weight=1)
+
         # Ollama API Address
-        self.ollama_frame = ttk.Frame(connection_frame)
-        self.ollama_frame.pack(fill='x', pady=5)
+        self.ollama_frame = ttk.Frame(provider_frame)
         
         address_label = ttk.Label(self.ollama_frame, text="Ollama API Address:")
         address_label.pack(side='left')
         
-        self.address_entry = ttk.Entry(self.ollama_frame, width=30)
+        self._address_var = tk.StringVar(value=self.ollama_address)
+        self.address_entry = ttk.Entry(self.ollama_frame, width=30, textvariable=self._address_var)
         self.address_entry.pack(side='left', padx=5, fill='x', expand=True)
-        self.address_entry.insert(0, self.ollama_address)
         
         # OpenAI API Key
-        self.openai_frame = ttk.Frame(connection_frame)
+        self.openai_frame = ttk.Frame(provider_frame)
         
         openai_key_label = ttk.Label(self.openai_frame, text="OpenAI API Key:")
         openai_key_label.pack(side='left')
         
-        self.openai_key_entry = ttk.Entry(self.openai_frame, width=40, show="*")
+        # Display masked key if it exists; the flag is cleared from a
+        # variable write trace, so only actual edits count, not mere
+        # cursor movement in the entry
+        self._openai_key_masked = bool(self._secrets["openai"])
+        self._openai_key_var = tk.StringVar(value=_MASK if self._openai_key_masked else "")
+        self.openai_key_entry = ttk.Entry(self.openai_frame, width=40, show="*", textvariable=self._openai_key_var)
         self.openai_key_entry.pack(side='left', padx=5, fill='x', expand=True)
-        # Display masked key if it exists
-        if self.openai_api_key:
-            self.openai_key_entry.insert(0, "*" * 12)
-        else:
-            self.openai_key_entry.insert(0, "")
+        self._openai_key_var.trace_add("write", lambda *_: setattr(self, "_openai_key_masked", False))
         
         # Anthropic API Key
-        self.anthropic_frame = ttk.Frame(connection_frame)
+        self.anthropic_frame = ttk.Frame(provider_frame)
         
         anthropic_key_label = ttk.Label(self.anthropic_frame, text="Anthropic API Key:")
         anthropic_key_label.pack(side='left')
         
-        self.anthropic_key_entry = ttk.Entry(self.anthropic_frame, width=40, show="*")
+        # Display masked key if it exists; the flag is cleared from a
+        # variable write trace, so only actual edits count, not mere
+        # cursor movement in the entry
+        self._anthropic_key_masked = bool(self._secrets["anthropic"])
+        self._anthropic_key_var = tk.StringVar(value=_MASK if self._anthropic_key_masked else "")
+        self.anthropic_key_entry = ttk.Entry(self.anthropic_frame, width=40, show="*", textvariable=self._anthropic_key_var)
         self.anthropic_key_entry.pack(side='left', padx=5, fill='x', expand=True)
-        # Display masked key if it exists
-        if self.anthropic_api_key:
-            self.anthropic_key_entry.insert(0, "*" * 12)
-        else:
-            self.anthropic_key_entry.insert(0, "")
+        self._anthropic_key_var.trace_add("write", lambda *_: setattr(self, "_anthropic_key_masked", False))
             
         # Grok API Key
-        self.grok_frame = ttk.Frame(connection_frame)
+        self.grok_frame = ttk.Frame(provider_frame)
         
         grok_key_label = ttk.Label(self.grok_frame, text="Grok API Key:")
         grok_key_label.pack(side='left')
         
-        self.grok_key_entry = ttk.Entry(self.grok_frame, width=40, show="*")
+        # Display masked key if it exists; the flag is cleared from a
+        # variable write trace, so only actual edits count, not mere
+        # cursor movement in the entry
+        self._grok_key_masked = bool(self._secrets["grok"])
+        self._grok_key_var = tk.StringVar(value=_MASK if self._grok_key_masked else "")
+        self.grok_key_entry = ttk.Entry(self.grok_frame, width=40, show="*", textvariable=self._grok_key_var)
         self.grok_key_entry.pack(side='left', padx=5, fill='x', expand=True)
-        # Display masked key if it exists
-        if hasattr(self, 'grok_api_key') and self.grok_api_key:
-            self.grok_key_entry.insert(0, "*" * 12)
-        else:
-            self.grok_key_entry.insert(0, "")
+        self._grok_key_var.trace_add("write", lambda *_: setattr(self, "_grok_key_masked", False))
             
         # Gemini API Key
-        self.gemini_frame = ttk.Frame(connection_frame)
+        self.gemini_frame = ttk.Frame(provider_frame)
         
         gemini_key_label = ttk.Label(self.gemini_frame, text="Gemini API Key:")
         gemini_key_label.pack(side='left')
         
-        self.gemini_key_entry = ttk.Entry(self.gemini_frame, width=40, show="*")
+        # Display masked key if it exists; the flag is cleared from a
+        # variable write trace, so only actual edits count, not mere
+        # cursor movement in the entry
+        self._gemini_key_masked = bool(self._secrets["gemini"])
+        self._gemini_key_var = tk.StringVar(value=_MASK if self._gemini_key_masked else "")
+        self.gemini_key_entry = ttk.Entry(self.gemini_frame, width=40, show="*", textvariable=self._gemini_key_var)
         self.gemini_key_entry.pack(side='left', padx=5, fill='x', expand=True)
-        # Display masked key if it exists
-        if hasattr(self, 'gemini_api_key') and self.gemini_api_key:
-            self.gemini_key_entry.insert(0, "*" * 12)
-        else:
-            self.gemini_key_entry.insert(0, "")
-        
+        self._gemini_key_var.trace_add("write", lambda *_: setattr(self, "_gemini_key_masked", False))
+        
+        # Place every provider row once; visibility is then toggled
+        # per row without re-measuring the others
+        self._api_frames = {
+            "ollama": self.ollama_frame,
+            "openai": self.openai_frame,
+            "anthropic": self.anthropic_frame,
+            "grok": self.grok_frame,
+            "gemini": self.gemini_frame,
+        }
+        for row, frame in enumerate(self._api_frames.values()):
+            frame.grid(row=row, column=0, sticky='ew', pady=5)
+            frame.grid_remove()
+
         # Apply API Settings button
         self.apply_api_btn = GUIComponents.create_button(
             connection_frame, "Apply API Settings", self.apply_api_settings, pady=5
@@ -239,9 +339,9 @@ class DualAgentChatGUI:
         name_label1 = ttk.Label(name_frame1, text="Agent 1 Name:")
         name_label1.pack(side='left')
         
-        self.agent1_name_entry = ttk.Entry(name_frame1, width=20)
+        self._agent1_name_var = tk.StringVar(value=self.agent1_name)
+        self.agent1_name_entry = ttk.Entry(name_frame1, width=20, textvariable=self._agent1_name_var)
         self.agent1_name_entry.pack(side='left', padx=5)
-        self.agent1_name_entry.insert(0, self.agent1_name)
         
         # Model Selection for Agent 1
         model_label1 = ttk.Label(agent1_frame, text="Select AI Model for Agent 1:")
@@ -253,9 +353,9 @@ class DualAgentChatGUI:
         system_prompt_label1 = ttk.Label(agent1_frame, text="System Prompt for Agent 1:")
         system_prompt_label1.pack(anchor='w', pady=(10, 0))
         
-        self.system_prompt_entry1 = ttk.Entry(agent1_frame, width=50)
+        self._system_prompt_var1 = tk.StringVar(value=self.default_system_prompt1)
+        self.system_prompt_entry1 = ttk.Entry(agent1_frame, width=50, textvariable=self._system_prompt_var1)
         self.system_prompt_entry1.pack(fill='x', pady=5)
-        self.system_prompt_entry1.insert(0, self.default_system_prompt1)
         
         # Agent 2 Settings Section
         agent2_frame = GUIComponents.create_labeled_frame(self.settings_frame, "Agent 2 Settings")
@@ -267,9 +367,9 @@ class DualAgentChatGUI:
         name_label2 = ttk.Label(name_frame2, text="Agent 2 Name:")
         name_label2.pack(side='left')
         
-        self.agent2_name_entry = ttk.Entry(name_frame2, width=20)
+        self._agent2_name_var = tk.StringVar(value=self.agent2_name)
+        self.agent2_name_entry = ttk.Entry(name_frame2, width=20, textvariable=self._agent2_name_var)
         self.agent2_name_entry.pack(side='left', padx=5)
-        self.agent2_name_entry.insert(0, self.agent2_name)
         
         # Model Selection for Agent 2
         model_label2 = ttk.Label(agent2_frame, text="Select AI Model for Agent 2:")
@@ -281,9 +381,9 @@ class DualAgentChatGUI:
         system_prompt_label2 = ttk.Label(agent2_frame, text="System Prompt for Agent 2:")
         system_prompt_label2.pack(anchor='w', pady=(10, 0))
         
-        self.system_prompt_entry2 = ttk.Entry(agent2_frame, width=50)
+        self._system_prompt_var2 = tk.StringVar(value=self.default_system_prompt2)
+        self.system_prompt_entry2 = ttk.Entry(agent2_frame, width=50, textvariable=self._system_prompt_var2)
         self.system_prompt_entry2.pack(fill='x', pady=5)
-        self.system_prompt_entry2.insert(0, self.default_system_prompt2)
         
         # Refresh models button
         self.refresh_models_btn = GUIComponents.create_button(
@@ -293,13 +393,14 @@ class DualAgentChatGUI:
         # Conversation Settings Section
         self.conversation_settings_frame = GUIComponents.create_labeled_frame(self.settings_frame, "Conversation Settings")
         
-        # Initial prompt
-        prompt_label = ttk.Label(self.conversation_settings_frame, text=f"Initial Prompt (from {self.agent1_name}):")
-        prompt_label.pack(anchor='w', pady=(5, 0))
+        # Initial prompt; kept as an attribute so retitling it doesn't
+        # require scanning the frame's children
+        self.initial_prompt_label = ttk.Label(self.conversation_settings_frame, text=f"Initial Prompt (from {self.agent1_name}):")
+        self.initial_prompt_label.pack(anchor='w', pady=(5, 0))
         
-        self.initial_prompt_entry = ttk.Entry(self.conversation_settings_frame, width=50)
+        self._initial_prompt_var = tk.StringVar(value=self.default_prompt)
+        self.initial_prompt_entry = ttk.Entry(self.conversation_settings_frame, width=50, textvariable=self._initial_prompt_var)
         self.initial_prompt_entry.pack(fill='x', pady=5)
-        self.initial_prompt_entry.insert(0, self.default_prompt)
         
         # Max turns
         turns_frame = ttk.Frame(self.conversation_settings_frame)
@@ -308,9 +409,9 @@ class DualAgentChatGUI:
         turns_label = ttk.Label(turns_frame, text="Maximum Turns:")
         turns_label.pack(side='left')
         
-        self.turns_spinbox = ttk.Spinbox(turns_frame, from_=1, to=50, width=5)
+        self._turns_var = tk.StringVar(value=str(self.max_turns))
+        self.turns_spinbox = ttk.Spinbox(turns_frame, from_=1, to=50, width=5, textvariable=self._turns_var)
         self.turns_spinbox.pack(side='left', padx=5)
-        self.turns_spinbox.set(self.max_turns)
         
         # Delay between turns
         delay_frame = ttk.Frame(self.conversation_settings_frame)
@@ -319,9 +420,20 @@ class DualAgentChatGUI:
         delay_label = ttk.Label(delay_frame, text="Delay Between Turns (seconds):")
         delay_label.pack(side='left')
         
-        self.delay_spinbox = ttk.Spinbox(delay_frame, from_=0, to=10, increment=0.5, width=5)
+        self._delay_var = tk.StringVar(value=str(self.turn_delay))
+        self.delay_spinbox = ttk.Spinbox(delay_frame, from_=0, to=10, increment=0.5, width=5, textvariable=self._delay_var)
         self.delay_spinbox.pack(side='left', padx=5)
-        self.delay_spinbox.set(self.turn_delay)
+
+        # History window: how many recent messages each request carries
+        history_frame = ttk.Frame(self.conversation_settings_frame)
+        history_frame.pack(fill='x', pady=5)
+
+        history_label = ttk.Label(history_frame, text="History Window (messages, 0 = all):")
+        history_label.pack(side='left')
+
+        self._history_window_var = tk.StringVar(value=str(self.history_window))
+        self.history_spinbox = ttk.Spinbox(history_frame, from_=0, to=100, increment=2, width=5, textvariable=self._history_window_var)
+        self.history_spinbox.pack(side='left', padx=5)
     
     def setup_conversation_tab(self):
         """Set up the conversation tab with logs and controls."""
@@ -364,6 +476,10 @@ class DualAgentChatGUI:
         # Turn counter
         self.turn_label = ttk.Label(context_info_frame, text="Turn: 0/0")
         self.turn_label.pack(side='right', padx=10)
+
+        # Response-cache hit counter
+        self.cache_hits_label = ttk.Label(context_info_frame, text="Cache hits: 0")
+        self.cache_hits_label.pack(side='right', padx=10)
         
         # Clear logs button
         self.clear_logs_btn = GUIComponents.create_button(
@@ -400,45 +516,50 @@ class DualAgentChatGUI:
         )
         
     # ===== UI Action Methods =====
-    
+
+    def submit_background(self, fn, *args, on_done=None):
+        """Run a callable on the shared worker pool.
+
+        Keeps blocking work (handler calls, model fetches) off the Tk
+        main thread; the result is marshalled back onto it.
+
+        Args:
+            fn: The callable to run
+            *args: Positional arguments for the callable
+            on_done: Optional callback invoked on the Tk main thread
+                with the result
+
+        Returns:
+            The submitted Future
+        """
+        future = _EXECUTOR.submit(fn, *args)
+        if on_done is not None:
+            future.add_done_callback(
+                lambda f: self.root.after(0, lambda: on_done(f.result()))
+            )
+        return future
+
     def update_api_settings_visibility(self):
         """Update the visibility of API settings based on selected API types."""
-        api_type1 = self.api_type_combo1.get()
-        api_type2 = self.api_type_combo2.get()
-        
-        # Hide all frames first
-        self.ollama_frame.pack_forget()
-        self.openai_frame.pack_forget()
-        self.anthropic_frame.pack_forget()
-        self.grok_frame.pack_forget()
-        self.gemini_frame.pack_forget()
-        
-        # Show relevant frames based on selected API types
-        if "ollama" in (api_type1, api_type2):
-            self.ollama_frame.pack(fill='x', pady=5)
-            
-        if "openai" in (api_type1, api_type2):
-            self.openai_frame.pack(fill='x', pady=5)
-            
-        if "anthropic" in (api_type1, api_type2):
-            self.anthropic_frame.pack(fill='x', pady=5)
-            
-        if "grok" in (api_type1, api_type2):
-            self.grok_frame.pack(fill='x', pady=5)
-            
-        if "gemini" in (api_type1, api_type2):
-            self.gemini_frame.pack(fill='x', pady=5)
+        selected = {self.api_type_combo1.get(), self.api_type_combo2.get()}
+
+        for api_type, frame in self._api_frames.items():
+            if api_type in selected:
+                frame.grid()
+            else:
+                frame.grid_remove()
     
     def apply_api_settings(self):
         """Apply the API settings."""
         # Get API types
         new_api_type1 = self.api_type_combo1.get()
         new_api_type2 = self.api_type_combo2.get()
+        selected = {new_api_type1, new_api_type2}
         
         # Get Ollama address if needed
         new_ollama_address = ""
-        if "ollama" in (new_api_type1, new_api_type2):
-            new_ollama_address = self.address_entry.get().strip()
+        if "ollama" in selected:
+            new_ollama_address = self._address_var.get().strip()
             if not new_ollama_address:
                 messagebox.showerror("Error", "Please enter a valid Ollama API address")
                 return
@@ -446,85 +567,48 @@ class DualAgentChatGUI:
             # Validate the address format
             if not (new_ollama_address.startswith("http://") or new_ollama_address.startswith("https://")):
                 new_ollama_address = "http://" + new_ollama_address
-                self.address_entry.delete(0, 'end')
-                self.address_entry.insert(0, new_ollama_address)
+                self._address_var.set(new_ollama_address)
             
             self.ollama_address = new_ollama_address
         
-        # Get API keys if needed
-        new_openai_key = ""
-        if "openai" in (new_api_type1, new_api_type2):
-            new_openai_key = self.openai_key_entry.get().strip()
-            # If the key is masked, use the existing key
-            if new_openai_key == "*" * 12:
-                new_openai_key = self.openai_api_key
-            elif not new_openai_key:
+        # Get API keys if needed; an untouched masked entry keeps the
+        # stored secret, with nothing re-read or compared
+        if "openai" in selected and not self._openai_key_masked:
+            new_openai_key = self._openai_key_var.get().strip()
+            if not new_openai_key:
                 messagebox.showerror("Error", "Please enter a valid OpenAI API key")
                 return
-            self.openai_api_key = new_openai_key
+            self._secrets["openai"] = new_openai_key
             
-        new_anthropic_key = ""
-        if "anthropic" in (new_api_type1, new_api_type2):
-            new_anthropic_key = self.anthropic_key_entry.get().strip()
-            # If the key is masked, use the existing key
-            if new_anthropic_key == "*" * 12:
-                new_anthropic_key = self.anthropic_api_key
-            elif not new_anthropic_key:
+        if "anthropic" in selected and not self._anthropic_key_masked:
+            new_anthropic_key = self._anthropic_key_var.get().strip()
+            if not new_anthropic_key:
                 messagebox.showerror("Error", "Please enter a valid Anthropic API key")
                 return
-            self.anthropic_api_key = new_anthropic_key
+            self._secrets["anthropic"] = new_anthropic_key
             
-        new_grok_key = ""
-        if "grok" in (new_api_type1, new_api_type2):
-            new_grok_key = self.grok_key_entry.get().strip()
-            # If the key is masked, use the existing key
-            if new_grok_key == "*" * 12:
-                new_grok_key = self.grok_api_key
-            elif not new_grok_key:
+        if "grok" in selected and not self._grok_key_masked:
+            new_grok_key = self._grok_key_var.get().strip()
+            if not new_grok_key:
                 messagebox.showerror("Error", "Please enter a valid Grok API key")
                 return
-            self.grok_api_key = new_grok_key
+            self._secrets["grok"] = new_grok_key
             
-        new_gemini_key = ""
-        if "gemini" in (new_api_type1, new_api_type2):
-            new_gemini_key = self.gemini_key_entry.get().strip()
-            # If the key is masked, use the existing key
-            if new_gemini_key == "*" * 12:
-                new_gemini_key = self.gemini_api_key
-            elif not new_gemini_key:
+        if "gemini" in selected and not self._gemini_key_masked:
+            new_gemini_key = self._gemini_key_var.get().strip()
+            if not new_gemini_key:
                 messagebox.showerror("Error", "Please enter a valid Gemini API key")
                 return
-            self.gemini_api_key = new_gemini_key
+            self._secrets["gemini"] = new_gemini_key
         
         # Update API types
         self.api_type1 = new_api_type1
         self.api_type2 = new_api_type2
         
-        # Create new API handlers
-        kwargs1 = {}
-        kwargs2 = {}
-        
-        if new_api_type1 == "ollama":
-            kwargs1["address"] = new_ollama_address
-        elif new_api_type1 == "openai":
-            kwargs1["api_key"] = new_openai_key
-        elif new_api_type1 == "anthropic":
-            kwargs1["api_key"] = new_anthropic_key
-        elif new_api_type1 == "grok":
-            kwargs1["api_key"] = new_grok_key
-        elif new_api_type1 == "gemini":
-            kwargs1["api_key"] = new_gemini_key
-            
-        if new_api_type2 == "ollama":
-            kwargs2["address"] = new_ollama_address
-        elif new_api_type2 == "openai":
-            kwargs2["api_key"] = new_openai_key
-        elif new_api_type2 == "anthropic":
-            kwargs2["api_key"] = new_anthropic_key
-        elif new_api_type2 == "grok":
-            kwargs2["api_key"] = new_grok_key
-        elif new_api_type2 == "gemini":
-            kwargs2["api_key"] = new_gemini_key
+        # Create new API handlers; the validated values were stored on
+        # self above, which is where the builders read from
+        kwargs1 = self._KWARG_BUILDERS[new_api_type1](self)
+        kwargs2 = self._KWARG_BUILDERS[new_api_type2](self)
         
         self.agent1 = APIFactory.create_handler(new_api_type1, self.logger, **kwargs1)
         self.agent2 = APIFactory.create_handler(new_api_type2, self.logger, **kwargs2)
@@ -533,46 +617,93 @@ class DualAgentChatGUI:
         self.logger.log(f"Updated Agent 1 to use {new_api_type1} API", "System")
         self.logger.log(f"Updated Agent 2 to use {new_api_type2} API", "System")
         
-        # Refresh models to test the connection - do this separately for each agent
-        # Get models for agent 1
-        models1 = self.agent1.get_available_models()
-        self.model_combo1['values'] = models1
-        if models1:
-            self.model_combo1.set(models1[0])
-            
-        # Get models for agent 2
-        models2 = self.agent2.get_available_models()
-        self.model_combo2['values'] = models2
-        if models2:
-            # Try to set a different model for agent 2 if available
-            if len(models2) > 1:
-                self.model_combo2.set(models2[1])
+        # Refresh models to test the connection, reusing the previous
+        # fetch whenever an agent's provider endpoint is unchanged;
+        # fresh fetches run in parallel on the worker pool so the
+        # window never blocks on a slow endpoint
+        key1 = self._endpoint_key(new_api_type1)
+        if key1 != self._last_apply_key1:
+            models1 = self._models_by_key.get(key1)
+            if models1 is None:
+                self.submit_background(self._fetch_models, 1, self.agent1,
+                                       new_api_type1, on_done=self._apply_models)
             else:
-                self.model_combo2.set(models2[0])
-    
+                self._apply_models((1, key1, models1))
+
+        key2 = self._endpoint_key(new_api_type2)
+        if key2 != self._last_apply_key2:
+            models2 = self._models_by_key.get(key2)
+            if models2 is None:
+                self.submit_background(self._fetch_models, 2, self.agent2,
+                                       new_api_type2, on_done=self._apply_models)
+            else:
+                self._apply_models((2, key2, models2))
+
+    def _endpoint_key(self, api_type):
+        """Identify a provider endpoint for model-list caching.
+
+        Args:
+            api_type: The provider name
+
+        Returns:
+            Tuple of the provider name and its current address or key
+        """
+        kwargs = self._KWARG_BUILDERS[api_type](self)
+        return (api_type, kwargs.get("address") or kwargs.get("api_key"))
+
     def refresh_models(self):
-        """Refresh the list of available models for both agents."""
-        # Get models for agent 1
-        try:
-            models1 = self.agent1.get_available_models()
-            self.model_combo1['values'] = models1
-            if models1:
-                self.model_combo1.set(models1[0])
-        except Exception as e:
-            self.logger.log(f"Error loading models for Agent 1: {str(e)}", "Error")
-            
-        # Get models for agent 2
+        """Refresh the list of available models for both agents.
+
+        Both fetches run in parallel on the worker pool so a slow
+        endpoint never freezes the window; each result is applied on
+        the Tk thread as it arrives.
+        """
+        self.submit_background(self._fetch_models, 1, self.agent1, self.api_type1,
+                               on_done=self._apply_models)
+        self.submit_background(self._fetch_models, 2, self.agent2, self.api_type2,
+                               on_done=self._apply_models)
+
+    def _fetch_models(self, which, agent, api_type):
+        """Fetch an agent's model list on a worker thread.
+
+        Args:
+            which: 1 or 2, identifying the agent
+            agent: The agent's handler
+            api_type: The agent's provider name
+
+        Returns:
+            Tuple of (which, endpoint key or None on error, model list)
+        """
         try:
-            models2 = self.agent2.get_available_models()
-            self.model_combo2['values'] = models2
-            if models2:
-                # Try to set a different model for agent 2 if available
-                if len(models2) > 1:
-                    self.model_combo2.set(models2[1])
-                else:
-                    self.model_combo2.set(models2[0])
+            key = self._endpoint_key(api_type)
+            return (which, key, agent.get_available_models())
         except Exception as e:
-            self.logger.log(f"Error loading models for Agent 2: {str(e)}", "Error")
+            self.logger.log(f"Error loading models for Agent {which}: {str(e)}", "Error")
+            return (which, None, [])
+
+    def _apply_models(self, result):
+        """Apply a fetched model list to the right combobox.
+
+        Runs on the Tk main thread.
+
+        Args:
+            result: The (which, key, models) tuple from _fetch_models
+        """
+        which, key, models = result
+        if key is not None:
+            self._models_by_key[key] = models
+            if which == 1:
+                self._last_apply_key1 = key
+            else:
+                self._last_apply_key2 = key
+        combo = self.model_combo1 if which == 1 else self.model_combo2
+        combo['values'] = models
+        if models:
+            # Try to set a different model for agent 2 if available
+            if which == 2 and len(models) > 1:
+                combo.set(models[1])
+            else:
+                combo.set(models[0])
     
     def start_conversation(self):
         """Start or stop the conversation between the two agents."""
@@ -589,32 +720,35 @@ class DualAgentChatGUI:
             self.agent2.set_model(model2)
             
             # Set system prompts
-            system_prompt1 = self.system_prompt_entry1.get()
-            system_prompt2 = self.system_prompt_entry2.get()
+            system_prompt1 = self._system_prompt_var1.get()
+            system_prompt2 = self._system_prompt_var2.get()
             self.agent1.set_system_prompt(system_prompt1)
             self.agent2.set_system_prompt(system_prompt2)
             
             # Get agent names
-            self.agent1_name = self.agent1_name_entry.get() or "Agent 1"
-            self.agent2_name = self.agent2_name_entry.get() or "Agent 2"
+            self.agent1_name = self._agent1_name_var.get() or "Agent 1"
+            self.agent2_name = self._agent2_name_var.get() or "Agent 2"
             
             # Update UI elements that reference agent names
             self.view_context1_btn.config(text=f"View {self.agent1_name} Context")
             self.view_context2_btn.config(text=f"View {self.agent2_name} Context")
             
             # Update the initial prompt label
-            for widget in self.conversation_settings_frame.winfo_children():
-                if isinstance(widget, ttk.Label) and "Initial Prompt" in widget.cget("text"):
-                    widget.config(text=f"Initial Prompt (from {self.agent1_name}):")
-                    break
+            self.initial_prompt_label.config(text=f"Initial Prompt (from {self.agent1_name}):")
             
             # Get conversation settings
             try:
-                self.max_turns = int(self.turns_spinbox.get())
-                self.turn_delay = float(self.delay_spinbox.get())
+                self.max_turns = int(self._turns_var.get())
+                self.turn_delay = float(self._delay_var.get())
+                self.history_window = int(self._history_window_var.get())
             except ValueError:
-                messagebox.showerror("Error", "Invalid values for turns or delay")
+                messagebox.showerror("Error", "Invalid values for turns, delay or history window")
                 return
+
+            # Cap what each request carries, keeping per-turn token
+            # cost flat instead of growing with the transcript
+            self.agent1.max_history_messages = self.history_window
+            self.agent2.max_history_messages = self.history_window
             
             # Clear previous conversation
             if self.logger and self.logger.text_widget.get(1.0, 'end').strip():
@@ -628,82 +762,88 @@ class DualAgentChatGUI:
             
             # Start conversation
             self.conversation_started = True
-            self.stop_conversation = False
+            self._loop.call_soon_threadsafe(self._stop_event.clear)
             self.current_turn = 0
             self.start_conv_btn.config(text="Stop Conversation")
             
             # Switch to conversation tab
             self.notebook.select(1)  # Select the conversation tab (index 1)
             
-            # Start conversation in a separate thread
-            self.conversation_thread = threading.Thread(target=self.run_conversation)
-            self.conversation_thread.daemon = True
-            self.conversation_thread.start()
+            # Drive the conversation coroutine on the background loop
+            self.conversation_future = asyncio.run_coroutine_threadsafe(
+                self.run_conversation(), self._loop)
         else:
-            # Stop conversation
-            self.stop_conversation = True
+            # Stop conversation; the event wakes the loop immediately,
+            # even mid-delay
+            self._loop.call_soon_threadsafe(self._stop_event.set)
             self.conversation_started = False
             self.start_conv_btn.config(text="Start Conversation")
             self.logger.log("Conversation stopped by user", "System")
     
-    def run_conversation(self):
-        """Run the conversation between the two agents."""
+    async def run_conversation(self):
+        """Run the conversation between the two agents.
+
+        Runs as a coroutine on the background asyncio loop; agent calls
+        go through the async handler API so the delay between turns and
+        any provider-side concurrency can overlap instead of
+        serializing on one thread.
+        """
         try:
             # Clear the clean conversation window
-            self.conv_text.delete(1.0, 'end')
+            self._ui_queue.put(("conv_clear", None))
             
             # Get the initial prompt
-            initial_prompt = self.initial_prompt_entry.get()
+            initial_prompt = self._initial_prompt_var.get()
             self.logger.log(f"Starting conversation with initial prompt: {initial_prompt}", "System")
             
             # Add initial prompt to clean conversation with clear indication it's the initial prompt
-            self.conv_text.insert('end', f"[Initial Prompt]\n{initial_prompt}\n\n")
+            self._ui_queue.put(("conv_insert", f"[Initial Prompt]\n{initial_prompt}\n\n"))
             
             # Inject the initial prompt as if it were a response from Agent 1
             # This way Agent 2 can respond to it naturally
-            self.agent1.conversation_history.append({"role": "assistant", "content": initial_prompt})
+            self.agent1.record_message("assistant", initial_prompt)
             
             # Initialize response2 variable before the loop
             response2 = initial_prompt
             
             # Run for the specified number of turns
             for turn in range(1, self.max_turns + 1):
-                if self.stop_conversation:
+                if self._stop_event.is_set():
                     break
                     
                 self.current_turn = turn
-                self.update_turn_counter()
+                self._post_turn_update()
                 
                 # Agent 2 responds to Agent 1's message
                 agent1_display = f"{self.agent1_name} ({self.agent1.selected_model})"
                 self.logger.log(response2, agent1_display)
-                response1 = self.agent2.get_response(response2)
-                
-                # Add to clean conversation
-                self.conv_text.insert('end', f"{self.agent2_name}: {response1}\n\n")
-                self.conv_text.see('end')
+                response1 = await self._agent_turn(
+                    self.agent2, response2, self.agent2_name)
                 
                 # Update UI
-                self.update_context_length()
-                time.sleep(self.turn_delay)
-                
-                if self.stop_conversation or turn == self.max_turns:
+                self._post_turn_update()
+                if self._stop_event.is_set() or turn == self.max_turns:
                     break
-                
-                # Agent 1 responds to Agent 2's message
+
+                # Pipeline: Agent 1's reply is requested before the
+                # inter-turn delay and its output held behind a gate
+                # until the delay elapses, so generation overlaps the
+                # pause instead of following it
                 agent2_display = f"{self.agent2_name} ({self.agent2.selected_model})"
                 self.logger.log(response1, agent2_display)
-                response2 = self.agent1.get_response(response1)
-                
-                # Add to clean conversation
-                self.conv_text.insert('end', f"{self.agent1_name}: {response2}\n\n")
-                self.conv_text.see('end')
+                release = threading.Event()
+                reply = asyncio.ensure_future(self._agent_turn(
+                    self.agent1, response1, self.agent1_name, release))
+                stopped = await self._delay_or_stop()
+                release.set()
+                response2 = await reply
                 
                 # Update UI
-                self.update_context_length()
-                time.sleep(self.turn_delay)
+                self._post_turn_update()
+                if stopped or await self._delay_or_stop():
+                    break
             
-            if not self.stop_conversation:
+            if not self._stop_event.is_set():
                 self.logger.log("Conversation completed (reached maximum turns)", "System")
                 self.conversation_started = False
                 self.root.after(0, lambda: self.start_conv_btn.config(text="Start Conversation"))
@@ -713,19 +853,187 @@ class DualAgentChatGUI:
             self.conversation_started = False
             self.root.after(0, lambda: self.start_conv_btn.config(text="Start Conversation"))
     
-    def update_turn_counter(self):
-        """Update the turn counter display."""
-        self.root.after(0, lambda: self.turn_label.config(text=f"Turn: {self.current_turn}/{self.max_turns}"))
+    async def _delay_or_stop(self):
+        """Wait out the turn delay unless a stop is requested.
+
+        Returns:
+            True when the conversation should stop
+        """
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=self.turn_delay)
+        except asyncio.TimeoutError:
+            pass
+        return self._stop_event.is_set()
+
+    def _conv_append(self, text):
+        """Append text to the clean conversation window.
+
+        The widget is capped to the last MAX_CONV_LINES lines so Tk's
+        text buffer can't degrade quadratically on long runs; the full
+        transcript is kept in _transcript for clipboard copies.
+
+        Args:
+            text: The text to insert
+        """
+        self._transcript.append(text)
+        self.conv_text.insert('end', text)
+        lines = int(self.conv_text.index('end-1c').split('.')[0])
+        if lines > self.MAX_CONV_LINES:
+            self.conv_text.delete('1.0', f'{lines - self.MAX_CONV_LINES}.0')
+        self.conv_text.see('end')
+
+    def _drain_ui_queue(self):
+        """Apply queued UI updates on the Tk main thread.
+
+        Runs every 30ms, handling up to 64 events per tick and
+        coalescing consecutive conversation inserts into one Text
+        operation, so streaming stays smooth without a redraw per
+        token.
+        """
+        pending_text = []
+
+        def flush_text():
+            if pending_text:
+                self._conv_append(''.join(pending_text))
+                pending_text.clear()
+
+        for _ in range(64):
+            try:
+                kind, payload = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "conv_insert":
+                pending_text.append(payload)
+                continue
+            flush_text()
+            if kind == "conv_clear":
+                self._transcript.clear()
+                self.conv_text.delete(1.0, 'end')
+            elif kind == "turn_update":
+                current, maximum, hits, count1, count2 = payload
+                self.turn_label.config(text=f"Turn: {current}/{maximum}")
+                self.cache_hits_label.config(text=f"Cache hits: {hits}")
+                self.context_length_label1.config(
+                    text=f"{self.agent1_name}: {count1} messages")
+                self.context_length_label2.config(
+                    text=f"{self.agent2_name}: {count2} messages")
+            elif kind == "context":
+                self._ctx_update_pending = False
+                count1 = self.agent1.get_conversation_length()
+                count2 = self.agent2.get_conversation_length()
+                self.context_length_label1.config(
+                    text=f"{self.agent1_name}: {count1} messages")
+                self.context_length_label2.config(
+                    text=f"{self.agent2_name}: {count2} messages")
+
+        flush_text()
+        self.root.after(30, self._drain_ui_queue)
+
+    async def _agent_turn(self, agent, prompt, display_name, release=None):
+        """Run one streamed agent turn off the event loop.
+
+        Args:
+            agent: The handler that should respond
+            prompt: The message the agent is responding to
+            display_name: The agent's display name for the window
+            release: Optional threading.Event; when given, output is
+                buffered and only rendered once the event is set
+
+        Returns:
+            The agent's full response text
+        """
+        return await asyncio.to_thread(
+            self._consume_stream, agent, prompt, display_name, release)
+
+    def _consume_stream(self, agent, prompt, display_name, release=None):
+        """Stream one agent reply into the conversation window.
+
+        Token deltas are buffered and flushed to the Tk thread every
+        50ms, so the reply appears as it is generated without thrashing
+        the Text widget with per-token updates. A release gate, when
+        supplied, holds all output back until it is set, which lets a
+        pipelined request generate during the inter-turn delay without
+        rendering ahead of it.
+
+        Args:
+            agent: The handler that should respond
+            prompt: The message the agent is responding to
+            display_name: The agent's display name for the window
+            release: Optional threading.Event gating display
+
+        Returns:
+            The agent's full response text
+        """
+        parts = []
+        pending = [f"{display_name}: "]
+        last_flush = time.monotonic()
+
+        def flush():
+            if pending and (release is None or release.is_set()):
+                self._ui_queue.put(("conv_insert", ''.join(pending)))
+                pending.clear()
+
+        flush()
+        for delta in agent.get_response_stream(prompt):
+            parts.append(delta)
+            pending.append(delta)
+            now = time.monotonic()
+            if now - last_flush >= 0.05:
+                flush()
+                last_flush = now
+
+        if release is not None:
+            # Hold the assembled reply until the pacing delay elapses
+            release.wait()
+        pending.append("\n\n")
+        flush()
+        return ''.join(parts)
+
+    def _post_turn_update(self):
+        """Queue one combined per-turn status update.
+
+        Bundles the turn counter, cache-hit counter and both context
+        lengths into a single event, so each turn costs the drain one
+        batch of label writes and one redraw instead of several.
+        """
+        self._ui_queue.put(("turn_update", (
+            self.current_turn,
+            self.max_turns,
+            self.agent1.cache_hits + self.agent2.cache_hits,
+            self.agent1.get_conversation_length(),
+            self.agent2.get_conversation_length(),
+        )))
     
     def view_context1(self):
         """View Agent 1's conversation context."""
-        history = self.agent1.get_conversation_history()
-        GUIComponents.create_context_viewer(self.root, history, f"{self.agent1_name} Context")
+        GUIComponents.create_context_viewer(
+            self.root, self._context_pager(self.agent1), f"{self.agent1_name} Context")
     
     def view_context2(self):
         """View Agent 2's conversation context."""
-        history = self.agent2.get_conversation_history()
-        GUIComponents.create_context_viewer(self.root, history, f"{self.agent2_name} Context")
+        GUIComponents.create_context_viewer(
+            self.root, self._context_pager(self.agent2), f"{self.agent2_name} Context")
+
+    def _context_pager(self, agent):
+        """Build a page fetcher over an agent's context.
+
+        The viewer pulls the transcript through this in chunks via
+        get_conversation_page; the system prompt is presented ahead of
+        the first page, matching what the agent actually sends.
+
+        Args:
+            agent: The handler whose context to page
+
+        Returns:
+            Callable taking (offset, limit) and returning the messages
+            in that range
+        """
+        def fetch(offset, limit):
+            page = agent.get_conversation_page(offset, limit)
+            if offset == 0 and agent.system_prompt:
+                return [{"role": "system", "content": agent.system_prompt}, *page]
+            return page
+        return fetch
     
     def clear_context(self):
         """Clear both agents' conversation contexts."""
@@ -736,15 +1044,21 @@ class DualAgentChatGUI:
             self.update_context_length()
     
     def update_context_length(self):
-        """Update the context length displays."""
-        count1 = self.agent1.get_conversation_length()
-        count2 = self.agent2.get_conversation_length()
-        self.root.after(0, lambda: self.context_length_label1.config(text=f"{self.agent1_name}: {count1} messages"))
-        self.root.after(0, lambda: self.context_length_label2.config(text=f"{self.agent2_name}: {count2} messages"))
+        """Update the context length displays.
+
+        Coalesced: while an update is already queued, further calls are
+        no-ops, so rapid successive calls cost one label write instead
+        of queuing a backlog. The drain reads the counts when it runs,
+        so the displayed values are current either way.
+        """
+        if self._ctx_update_pending:
+            return
+        self._ctx_update_pending = True
+        self._ui_queue.put(("context", None))
     
     def copy_conversation_to_clipboard(self):
         """Copy the clean conversation to clipboard."""
-        conversation_text = self.conv_text.get(1.0, 'end-1c')
+        conversation_text = ''.join(self._transcript)
         if conversation_text.strip():
             self.root.clipboard_clear()
             self.root.clipboard_append(conversation_text)
@@ -760,6 +1074,7 @@ class DualAgentChatGUI:
         """
         if not confirm or messagebox.askyesno("Clear Logs", "Are you sure you want to clear the message log?"):
             self.logger.clear()
+            self._transcript.clear()
             self.conv_text.delete(1.0, 'end')
 
 if __name__ == "__main__":
@@ -15,30 +15,43 @@
 
 import ollama
 import requests
-import os
-from api_handler import APIHandler
+from api_handler import APIHandler, cached_response, cached_stream
 
 class OllamaHandler(APIHandler):
     """Handler for Ollama API interactions."""
     
-    def __init__(self, logger, address="http://localhost:11434"):
+    def __init__(self, logger, address="http://localhost:11434", session=None):
         """Initialize the Ollama handler.
-        
+
         Args:
             logger: The logger instance
             address: The Ollama API address (default: http://localhost:11434)
+            session: Optional shared requests.Session; one is created
+                when not provided
         """
         super().__init__(logger)
         self.address = address
-    
+        self.session = session if session is not None else requests.Session()
+        # Keep the model resident between turns; without this Ollama may
+        # unload it after its default idle window, and alternating agents
+        # on different models would force a reload every turn
+        self.keep_alive = "1h"
+        # Optional generation options (num_ctx, num_batch, ...) sent with
+        # every chat call so repeated turns share one KV-cache shape
+        self.options = None
+        # One client per address, so every chat call reuses its pooled
+        # connection instead of building a client (and socket) per turn
+        self.client = ollama.Client(host=address)
+        self._async_client = None
+
     def get_available_models(self):
         """Get a list of available Ollama models.
-        
+
         Returns:
             List of model names or empty list if error
         """
         try:
-            response = requests.get(f'{self.address}/api/tags')
+            response = self.session.get(f'{self.address}/api/tags', timeout=5)
             if response.status_code == 200:
                 models = [model['name'] for model in response.json()['models']]
                 if models and self.logger:
@@ -58,9 +71,12 @@ class OllamaHandler(APIHandler):
             address: The Ollama API address (e.g., http://localhost:11434)
         """
         self.address = address
+        self.client = ollama.Client(host=address)
+        self._async_client = None
         if self.logger:
             self.logger.log(f"Set Ollama API address to: {address}", "Ollama")
     
+    @cached_response
     def get_response(self, prompt):
         """Get a response from Ollama for the given prompt.
         
@@ -75,34 +91,110 @@ class OllamaHandler(APIHandler):
                 self.logger.log("No model selected", "Error")
             return "Error: No model selected"
         
-        # Create messages list with system prompt if available
-        messages = []
-        if self.system_prompt:
-            messages.append({"role": "system", "content": self.system_prompt})
-        
-        # Add conversation history
-        messages.extend(self.conversation_history)
-        
-        # Add current prompt
-        self.conversation_history.append({"role": "user", "content": prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt)
         
         try:
             if self.logger:
                 self.logger.log(f"Sending prompt to {self.selected_model}", "Ollama")
-            # Configure ollama client with custom address
-            os.environ["OLLAMA_HOST"] = self.address
-            
-            response = ollama.chat(
+            response = self.client.chat(
                 model=self.selected_model,
-                messages=messages
+                messages=messages,
+                keep_alive=self.keep_alive,
+                options=self.options
             )
             assistant_response = response["message"]["content"]
-            self.conversation_history.append(
-                {"role": "assistant", "content": assistant_response}
-            )
+            self.record_message("assistant", assistant_response)
+            return assistant_response
+        except Exception as e:
+            self._pop_failed_turn()
+            if self.logger:
+                self.logger.log(f"Error generating response: {str(e)}", "Error")
+            self._show_error(f"Cannot connect to Ollama API at {self.address}.\nPlease ensure Ollama is running with:\n\nollama serve")
+            return "Error: Could not generate response"
+
+    @cached_stream
+    def get_response_stream(self, prompt):
+        """Get a response from Ollama as a stream of text chunks.
+
+        Args:
+            prompt: The user's message to send to Ollama
+
+        Yields:
+            Chunks of the AI's response text
+        """
+        if not self.selected_model:
+            if self.logger:
+                self.logger.log("No model selected", "Error")
+            yield "Error: No model selected"
+            return
+
+        messages = self._build_messages(prompt)
+
+        try:
+            if self.logger:
+                self.logger.log(f"Streaming prompt to {self.selected_model}", "Ollama")
+            parts = []
+            for chunk in self.client.chat(
+                model=self.selected_model,
+                messages=messages,
+                stream=True,
+                keep_alive=self.keep_alive,
+                options=self.options
+            ):
+                text = chunk["message"]["content"]
+                if text:
+                    parts.append(text)
+                    yield text
+
+            self.record_message("assistant", "".join(parts))
+        except Exception as e:
+            self._pop_failed_turn()
+            if self.logger:
+                self.logger.log(f"Error generating response: {str(e)}", "Error")
+            self._show_error(f"Cannot connect to Ollama API at {self.address}.\nPlease ensure Ollama is running with:\n\nollama serve")
+            yield "Error: Could not generate response"
+
+    @cached_response
+    async def aget_response(self, prompt):
+        """Get a response from Ollama asynchronously.
+
+        Uses the native async client, so turns awaited from the event
+        loop overlap with other work instead of tying up a thread on a
+        blocking socket.
+
+        Args:
+            prompt: The user's message to send to Ollama
+
+        Returns:
+            The AI's response text
+        """
+        if not self.selected_model:
+            if self.logger:
+                self.logger.log("No model selected", "Error")
+            return "Error: No model selected"
+
+        messages = self._build_messages(prompt)
+
+        try:
+            if self.logger:
+                self.logger.log(f"Sending prompt to {self.selected_model}", "Ollama")
+            # The async client is created on first use and kept, so
+            # consecutive turns share its connection pool
+            if self._async_client is None:
+                self._async_client = ollama.AsyncClient(host=self.address)
+
+            async with self._request_semaphore:
+                response = await self._async_client.chat(
+                    model=self.selected_model,
+                    messages=messages,
+                    keep_alive=self.keep_alive,
+                    options=self.options
+                )
+            assistant_response = response["message"]["content"]
+            self.record_message("assistant", assistant_response)
             return assistant_response
         except Exception as e:
+            self._pop_failed_turn()
             if self.logger:
                 self.logger.log(f"Error generating response: {str(e)}", "Error")
             self._show_error(f"Cannot connect to Ollama API at {self.address}.\nPlease ensure Ollama is running with:\n\nollama serve")
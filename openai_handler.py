@@ -13,12 +13,22 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-from openai import OpenAI
-from api_handler import APIHandler
+import time
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+from api_handler import APIHandler, cached_response, cached_stream
+
+# Connection pool shared by each client instance; keep-alive sockets
+# make consecutive turns skip the TCP+TLS handshake
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=32)
 
 class OpenAIHandler(APIHandler):
     """Handler for OpenAI API interactions."""
-    
+
+    # Seconds to serve the model list from cache before refetching
+    MODELS_CACHE_TTL = 60
+
     def __init__(self, logger, api_key=None):
         """Initialize the OpenAI handler.
         
@@ -29,6 +39,9 @@ class OpenAIHandler(APIHandler):
         super().__init__(logger)
         self.api_key = api_key
         self.client = None
+        self.async_client = None
+        self._models_cache = None
+        self._models_cache_ts = 0
         if api_key:
             self.set_api_key(api_key)
     
@@ -39,8 +52,17 @@ class OpenAIHandler(APIHandler):
             api_key: The OpenAI API key
         """
         self.api_key = api_key
+        # A new key can see a different model catalog
+        self._models_cache = None
         try:
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(
+                api_key=api_key,
+                http_client=httpx.Client(limits=_HTTP_LIMITS)
+            )
+            self.async_client = AsyncOpenAI(
+                api_key=api_key,
+                http_client=httpx.AsyncClient(limits=_HTTP_LIMITS)
+            )
             if self.logger:
                 self.logger.log("OpenAI API key set", "OpenAI")
         except Exception as e:
@@ -49,13 +71,21 @@ class OpenAIHandler(APIHandler):
     def get_available_models(self):
         """Get a list of available OpenAI models.
         
+        The filtered list is cached for MODELS_CACHE_TTL seconds, so
+        repeated refreshes within that window skip both the API call and
+        re-filtering the full catalog. Setting a new key invalidates it.
+
         Returns:
             List of model names or empty list if error
         """
         if not self.api_key or not self.client:
             self._show_error("API key not set. Please set your OpenAI API key.")
             return []
-            
+
+        if (self._models_cache
+                and time.monotonic() - self._models_cache_ts < self.MODELS_CACHE_TTL):
+            return self._models_cache
+
         try:
             models_list = self.client.models.list()
             # Filter for chat models
@@ -65,11 +95,14 @@ class OpenAIHandler(APIHandler):
             ]
             if chat_models and self.logger:
                 self.logger.log(f"Loaded {len(chat_models)} OpenAI models", "OpenAI")
+            self._models_cache = chat_models
+            self._models_cache_ts = time.monotonic()
             return chat_models
         except Exception as e:
             self._show_error(f"Error fetching OpenAI models: {str(e)}")
             return []
     
+    @cached_response
     def get_response(self, prompt):
         """Get a response from OpenAI for the given prompt.
         
@@ -89,17 +122,7 @@ class OpenAIHandler(APIHandler):
                 self.logger.log("No model selected", "Error")
             return "Error: No model selected"
         
-        # Create messages list with system prompt if available
-        messages = []
-        if self.system_prompt:
-            messages.append({"role": "system", "content": self.system_prompt})
-        
-        # Add conversation history
-        messages.extend(self.conversation_history)
-        
-        # Add current prompt
-        self.conversation_history.append({"role": "user", "content": prompt})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._build_messages(prompt)
         
         try:
             if self.logger:
@@ -111,11 +134,103 @@ class OpenAIHandler(APIHandler):
             )
             
             assistant_response = response.choices[0].message.content
-            self.conversation_history.append(
-                {"role": "assistant", "content": assistant_response}
-            )
+            self.record_message("assistant", assistant_response)
+            return assistant_response
+        except Exception as e:
+            self._pop_failed_turn()
+            if self.logger:
+                self.logger.log(f"Error generating response: {str(e)}", "Error")
+            self._show_error(f"OpenAI API error: {str(e)}")
+            return f"Error: Could not generate response - {str(e)}"
+
+    @cached_stream
+    def get_response_stream(self, prompt):
+        """Get a response from OpenAI as a stream of text chunks.
+
+        Args:
+            prompt: The user's message to send to OpenAI
+
+        Yields:
+            Chunks of the AI's response text
+        """
+        if not self.api_key or not self.client:
+            if self.logger:
+                self.logger.log("API key not set", "Error")
+            yield "Error: OpenAI API key not set"
+            return
+
+        if not self.selected_model:
+            if self.logger:
+                self.logger.log("No model selected", "Error")
+            yield "Error: No model selected"
+            return
+
+        messages = self._build_messages(prompt)
+
+        try:
+            if self.logger:
+                self.logger.log(f"Streaming prompt to {self.selected_model}", "OpenAI")
+
+            parts = []
+            for chunk in self.client.chat.completions.create(
+                model=self.selected_model,
+                messages=messages,
+                stream=True
+            ):
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+
+            self.record_message("assistant", "".join(parts))
+        except Exception as e:
+            self._pop_failed_turn()
+            if self.logger:
+                self.logger.log(f"Error generating response: {str(e)}", "Error")
+            self._show_error(f"OpenAI API error: {str(e)}")
+            yield f"Error: Could not generate response - {str(e)}"
+
+    @cached_response
+    async def aget_response(self, prompt):
+        """Get a response from OpenAI asynchronously.
+
+        Uses the native async client, so turns awaited from the event
+        loop overlap with other work instead of tying up a thread on a
+        blocking socket.
+
+        Args:
+            prompt: The user's message to send to OpenAI
+
+        Returns:
+            The AI's response text
+        """
+        if not self.api_key or not self.async_client:
+            if self.logger:
+                self.logger.log("API key not set", "Error")
+            return "Error: OpenAI API key not set"
+
+        if not self.selected_model:
+            if self.logger:
+                self.logger.log("No model selected", "Error")
+            return "Error: No model selected"
+
+        messages = self._build_messages(prompt)
+
+        try:
+            if self.logger:
+                self.logger.log(f"Sending prompt to {self.selected_model}", "OpenAI")
+
+            async with self._request_semaphore:
+                response = await self.async_client.chat.completions.create(
+                    model=self.selected_model,
+                    messages=messages
+                )
+
+            assistant_response = response.choices[0].message.content
+            self.record_message("assistant", assistant_response)
             return assistant_response
         except Exception as e:
+            self._pop_failed_turn()
             if self.logger:
                 self.logger.log(f"Error generating response: {str(e)}", "Error")
             self._show_error(f"OpenAI API error: {str(e)}")
@@ -0,0 +1,92 @@
+# Copyright (C) 2025 Jakub Budrewicz
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+
+class DiskResponseCache:
+    """Exact-match response cache persisted on disk.
+
+    Entries are stored one file per key so replays of the same
+    conversation (same model, system prompt, history and prompt) survive
+    restarts and cost nothing at the provider. Keys are the handlers'
+    response-cache digests, so only byte-identical turns ever hit.
+    """
+
+    def __init__(self, directory=".llm_cache"):
+        """Initialize the cache under the given directory.
+
+        Args:
+            directory: Directory to store cache entries in; created if
+                missing
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_env(cls):
+        """Create a cache when enabled via the environment.
+
+        Persistent caching is opt-in for development runs so normal use
+        never accumulates transcripts on disk.
+
+        Returns:
+            A DiskResponseCache rooted at $LLM_CACHE_DIR, or None when
+            the variable is unset
+        """
+        directory = os.environ.get("LLM_CACHE_DIR")
+        if not directory:
+            return None
+        return cls(directory)
+
+    def _path(self, key):
+        """Get the file path for a cache key.
+
+        Args:
+            key: The cache key hex digest
+
+        Returns:
+            The path of the entry file
+        """
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """Look up a cached response.
+
+        Args:
+            key: The cache key hex digest
+
+        Returns:
+            The cached response text, or None on a miss
+        """
+        try:
+            with open(self._path(key), encoding="utf-8") as handle:
+                return json.load(handle)["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key, response):
+        """Store a response on disk.
+
+        Args:
+            key: The cache key hex digest
+            response: The response text to store
+        """
+        try:
+            with open(self._path(key), "w", encoding="utf-8") as handle:
+                json.dump({"response": response}, handle)
+        except OSError:
+            # A full or read-only disk should never break a conversation
+            pass